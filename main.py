@@ -12,15 +12,66 @@ import os
 import sys
 import time
 import signal
+import atexit
 import logging
-import hashlib
-import random
+import logging.handlers
+import functools
+import math
+import platform
+import importlib.util
 from datetime import datetime
-from typing import Dict, Any
+from collections import defaultdict
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, TYPE_CHECKING
 import threading
-import numpy as np
-import psutil
-import argparse
+import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# argparse загружается в build_argument_parser; здесь — только для аннотаций типов
+if TYPE_CHECKING:
+    import argparse
+
+
+def lazy_import(name: str) -> Any:
+    """
+    Возвращает модуль, загружаемый при первом обращении к его атрибуту
+    (importlib.util.LazyLoader), или None, если модуль не установлен.
+    Позволяет не загружать тяжелые модули для --help и --list-configs.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def ensure_loaded(*modules: Any) -> None:
+    """
+    Завершает отложенную загрузку модулей, полученных через lazy_import.
+    Вызывается до запуска потока мониторинга и пула процессов: fork во время
+    загрузки модуля в другом потоке оставил бы дочерним процессам
+    недозагруженный модуль.
+    """
+    for module in modules:
+        if module is not None:
+            getattr(module, "__name__")
+
+
+# Тяжелые модули загружаются при первом использовании в тестах и мониторинге
+np = lazy_import("numpy")
+psutil = lazy_import("psutil")
+hashlib = lazy_import("hashlib")
+
+# Необязательная зависимость: CuPy для тестов на видеокарте (без нее тесты выполняются на CPU)
+cp = lazy_import("cupy")
 
 # ============================================================================
 # ВЫБОР РЕЖИМА РАБОТЫ
@@ -78,6 +129,12 @@ FILE_SYSTEM_CONFIG = {
     }
 }
 
+# Полные пути подкаталогов (категория -> base_path/имя подкаталога), вычисляются один раз
+DIRECTORY_PATHS = MappingProxyType({
+    category: os.path.join(FILE_SYSTEM_CONFIG["base_path"], subdir_config["name"])
+    for category, subdir_config in FILE_SYSTEM_CONFIG["subdirectories"].items()
+})
+
 # ============================================================================
 # ГЛОБАЛЬНЫЕ НАСТРОЙКИ И СЛОВАРИ
 # ============================================================================
@@ -96,16 +153,16 @@ DEFAULT_VALUES = {
     "processor_type": "auto"            # По умолчанию: автоматическое определение
 }
 
-TEST_TYPES = {
+TEST_TYPES = MappingProxyType({
     "basic": "Базовое тестирование производительности",
     "hash_calculation": "Расчет хешей SHA-256",
     "bitcoin_mining": "Симуляция майнинга биткойна",
     "matrix_operations": "Операции с матрицами",
     "prime_numbers": "Поиск простых чисел",
     "neural_simulation": "Симуляция нейронных вычислений"
-}
+})
 
-LOAD_TYPES = {
+LOAD_TYPES = MappingProxyType({
     "CPU": "Только процессор",
     "GPU": "Только видеокарта (если доступна)",
     "BOTH": "Процессор и видеокарта",
@@ -114,26 +171,44 @@ LOAD_TYPES = {
     "MEMORY_INTENSIVE": "Интенсивная нагрузка на память",
     "IO_INTENSIVE": "Интенсивная нагрузка на диск",
     "MIXED": "Смешанная нагрузка (CPU + память + диск)"
-}
+})
+
+# Типы нагрузки, при которых матричный и нейронный тесты выполняются на видеокарте
+GPU_LOAD_TYPES = ("GPU", "BOTH", "NEURAL")
 
 PROCESSOR_TYPES = {
     "X86": "Intel/AMD x86_64",
     "M": "Apple Silicon M-series"
 }
 
+# Ключи словарей выбора и уровни сложности (вычисляются один раз; порядок соответствует номерам в меню)
+TEST_TYPE_KEYS = tuple(TEST_TYPES)
+LOAD_TYPE_KEYS = tuple(LOAD_TYPES)
+PROCESSOR_TYPE_KEYS = tuple(PROCESSOR_TYPES)
+COMPLEXITY_LEVELS = ("easy", "medium", "hard")
+# Допустимые значения аргументов командной строки: словари дают проверку `in` за O(1)
+# по хешу и, в отличие от frozenset, сохраняют порядок в справке и сообщениях argparse
+COMPLEXITY_CHOICES = MappingProxyType(dict.fromkeys(COMPLEXITY_LEVELS))
+
 OPERATING_SYSTEMS = {
     "macOS": "Apple macOS",
     "Windows": "Microsoft Windows",
     "Linux": "Linux"
 }
 
+# Предел процессов ProcessPoolExecutor в Windows (при большем max_workers — ValueError)
+WINDOWS_MAX_WORKERS = 61
+
 TEST_SETTINGS = {
     "min_duration": 10,
     "max_duration": 60,
     "default_duration": 30,
     "interrupt_key": "q",
-    "monitoring_interval": 0.5,
-    "performance_mode": False  # True = режим тестирования производительности (без ограничения времени)
+    "monitoring_interval": 1.0,
+    "performance_mode": False,  # True = режим тестирования производительности (без ограничения времени)
+    "random_seed": None,        # Зерно генератора PCG64 (None = случайное; число — воспроизводимые данные)
+    "workers": None,            # Процессов для параллельных тестов (None = число ядер CPU)
+    "hwmon_path": "/sys/class/hwmon"  # Каталог датчиков Linux (температура читается из него напрямую)
 }
 
 COMPLEXITY_SETTINGS = {
@@ -159,26 +234,142 @@ COMPLEXITY_SETTINGS = {
     }
 }
 
-LOG_MESSAGES = {
+# Размеры пакетов для векторизованных вычислений (количество записей за один вызов)
+BATCH_SETTINGS = {
+    "hash_batch_size": 4096,               # Записей на один вызов sha256().update()
+    "hash_record_prefix": b"test_data_",   # Постоянный префикс каждой записи хеш-теста
+    "mining_block_prefix": b"block_data_", # Постоянный префикс заголовка блока при майнинге
+    "prime_segment_size": 1 << 15,         # Размер сегмента решета (нечетных чисел, ~32 КиБ)
+    "matrix_batch_count": 10,              # Количество пар матриц в одном пакете
+    "neural_batch_size": 1024,             # Примеров на одно пакетное прохождение сети
+    "basic_chunk_size": 1000000,           # Итераций базового теста между проверками прерывания
+    "random_block_size": 1 << 14,          # Элементов в блоке случайных данных с собственным ГСЧ (не зависит от числа процессов)
+    "mining_chunk_size": 10000,            # Nonce на один блок майнинга между проверками прерывания
+    "cpu_chunk_size": 10000,               # Итераций CPU-теста между проверками прерывания
+    "memory_chunk_size": 1,                # Больших массивов между проверками прерывания
+    "memory_array_size": 10000,            # Сторона квадратного массива float64 теста памяти (10000 — 800 МБ)
+    "memory_ring_slots": 5,                # Массивов в кольцевом буфере теста памяти
+    "io_chunk_size": 10,                   # Циклов запись/чтение между проверками прерывания
+    "mixed_chunk_size": 10,                # Итераций смешанной нагрузки между проверками прерывания
+    "parallel_tasks_per_worker": 4         # Задач на процесс пула (для равномерной загрузки и прогресса)
+}
+
+LOG_MESSAGES = MappingProxyType({
     "program_start": "Программа тестирования производительности запущена",
-    "system_info": "Система: {os_name} {os_version}, Процессор: {processor}, Архитектура: {architecture}",
-    "test_config": "Тип теста: {test_type}, Нагрузка: {load_type}, Сложность: {complexity}",
-    "test_start": "Начало тестирования в {start_time}",
-    "test_progress": "Прогресс теста: {progress:.1f}% ({elapsed:.1f}s / {total:.1f}s)",
-    "test_complete": "Тест завершен за {duration:.2f} секунд",
-    "performance_results": "Результаты производительности: CPU: {cpu_avg:.1f}% (пик: {cpu_peak:.1f}%), RAM: {ram_avg:.1f}% (пик: {ram_peak:.1f}%)",
-    "temperature_info": "Температура CPU: {cpu_temp:.1f}°C, GPU: {gpu_temp:.1f}°C",
+    "system_info": "Система: %(os_name)s %(os_version)s, Процессор: %(processor)s, Архитектура: %(architecture)s",
+    "test_config": "Тип теста: %(test_type)s, Нагрузка: %(load_type)s, Сложность: %(complexity)s",
+    "test_config_performance": "Тип теста: %(test_type)s, Нагрузка: %(load_type)s, Сложность: %(complexity)s, Режим: Тест производительности",
+    "test_start": "Начало тестирования в %(start_time)s",
+    "test_progress": "Прогресс теста: %(progress).1f%% (%(elapsed).1fs / %(total).1fs)",
+    "test_complete": "Тест завершен за %(duration).2f секунд",
+    "performance_results": "Результаты производительности: CPU: %(cpu_avg).1f%% (пик: %(cpu_peak).1f%%), RAM: %(ram_avg).1f%% (пик: %(ram_peak).1f%%)",
+    "temperature_info": "Температура CPU: %(cpu_temp).1f°C, GPU: %(gpu_temp).1f°C",
     "test_interrupted": "Тест прерван пользователем",
-    "error_occurred": "Ошибка: {error_message}",
+    "gpu_selected": "Тест %(test_name)s выполняется на видеокарте (CuPy)",
+    "gpu_unavailable": "Видеокарта недоступна (CuPy/CUDA не найдены), тест %(test_name)s выполняется на CPU",
+    "error_occurred": "Ошибка: %(error_message)s",
     "program_exit": "Программа завершена",
     "interactive_mode": "Запущен интерактивный режим выбора теста",
-    "config_selected": "Выбрана конфигурация: {config_name}"
+    "config_selected": "Выбрана конфигурация: %(config_name)s",
+    # Прогресс тестовых функций (done — обработано, total — всего, result — значение от ядра)
+    "progress_basic": "Базовый тест: %(done)s/%(total)s",
+    "progress_hash": "Хеш: %(done)s/%(total)s, Результат: %(result)s...",
+    "progress_mining": "Майнинг: %(done)s/%(total)s",
+    "progress_prime": "Простые числа: %(done)s/%(total)s, Найдено: %(result)s",
+    "progress_neural": "Нейронная сеть: %(done)s/%(total)s",
+    "progress_cpu": "CPU интенсивный: %(done)s/%(total)s",
+    "progress_memory": "Память интенсивный: %(done)s/%(total)s",
+    "progress_io": "Диск интенсивный: %(done)s/%(total)s",
+    "progress_mixed": "Смешанная нагрузка: %(done)s/%(total)s"
+})
+
+# Шаблоны вывода итогов теста в консоль (поля — ключи словаря результатов)
+RESULT_TEMPLATES = {
+    "summary": (
+        "\n" + "=" * 50 + "\n"
+        "РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ\n"
+        + "=" * 50 + "\n"
+        "Время выполнения: {duration:.2f} секунд\n"
+        "Средняя загрузка CPU: {cpu_usage_avg:.1f}%\n"
+        "Пиковая загрузка CPU: {cpu_usage_peak:.1f}%\n"
+        "Средняя загрузка RAM: {memory_usage_avg:.1f}%\n"
+        "Пиковая загрузка RAM: {memory_usage_peak:.1f}%\n"
+    ),
+    "cpu_temperature": "Средняя температура CPU: {cpu_temperature_avg:.1f}°C\n",
+    "gpu_temperature": "Средняя температура GPU: {gpu_temperature_avg:.1f}°C\n",
+    # Файл результатов (save_results_to_file): разделы температуры и специфичных
+    # результатов подставляются готовыми строками или пустыми, если данных нет
+    "report": (
+        "=" * 60 + "\n"
+        "РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ ПРОИЗВОДИТЕЛЬНОСТИ СИСТЕМЫ\n"
+        + "=" * 60 + "\n"
+        "Дата и время: {created_at}\n"
+        "\n"
+        "ИНФОРМАЦИЯ О СИСТЕМЕ:\n"
+        + "-" * 30 + "\n"
+        "Операционная система: {os_name}\n"
+        "Версия ОС: {os_version}\n"
+        "Процессор: {processor}\n"
+        "Архитектура: {architecture}\n"
+        "Тип процессора: {processor_type}\n"
+        "Версия Python: {python_version}\n"
+        "\n"
+        "КОНФИГУРАЦИЯ ТЕСТА:\n"
+        + "-" * 30 + "\n"
+        "Тип теста: {test_type}\n"
+        "Тип нагрузки: {load_type}\n"
+        "Сложность: {complexity}\n"
+        "Планируемая продолжительность: {planned_duration} секунд\n"
+        "\n"
+        "РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ:\n"
+        + "-" * 30 + "\n"
+        "Фактическое время выполнения: {duration:.2f} секунд\n"
+        "\n"
+        "ЗАГРУЗКА ПРОЦЕССОРА:\n"
+        "  Средняя загрузка: {cpu_usage_avg:.1f}%\n"
+        "  Пиковая загрузка: {cpu_usage_peak:.1f}%\n"
+        "\n"
+        "ИСПОЛЬЗОВАНИЕ ПАМЯТИ:\n"
+        "  Среднее использование: {memory_usage_avg:.1f}%\n"
+        "  Пиковое использование: {memory_usage_peak:.1f}%\n"
+        "\n"
+        "{temperature_section}"
+        "РЕЗУЛЬТАТЫ РАСЧЕТОВ:\n"
+        + "-" * 30 + "\n"
+        "Выполнено итераций: {iterations_completed:,}\n"
+        "Выполнено вычислений: {calculations_performed:,}\n"
+        "Обработано данных: {data_processed:,}\n"
+        "{specific_section}"
+        "\n"
+        "ДОПОЛНИТЕЛЬНАЯ ИНФОРМАЦИЯ:\n"
+        + "-" * 30 + "\n"
+        "Файл лога: {logs_dir}\n"
+        "Время создания отчета: {created_at}\n"
+        "\n"
+        + "=" * 60
+    ),
+    "report_temperature": "ТЕМПЕРАТУРА:\n",
+    "report_cpu_temperature": "  Средняя температура CPU: {:.1f}°C\n",
+    "report_gpu_temperature": "  Средняя температура GPU: {:.1f}°C\n",
+    "report_specific": "\nСПЕЦИФИЧНЫЕ РЕЗУЛЬТАТЫ ТЕСТА:\n",
+    "report_specific_item": "  {}: {}\n"
 }
 
+# Сообщения о неверной продолжительности теста (поля — ключи TEST_SETTINGS):
+# для аргумента --duration и для интерактивного ввода
+DURATION_MESSAGES = MappingProxyType({
+    "argument": "продолжительность должна быть целым числом от {min_duration} до {max_duration} секунд",
+    "interactive": "❌ Продолжительность должна быть от {min_duration} до {max_duration} секунд."
+})
+
+# Сообщение о прерывании: заранее закодировано, чтобы обработчик сигнала писал его
+# напрямую в stderr через os.write без print и буферов sys.stdout
+INTERRUPT_MESSAGE = "\n⚠️  Прерывание выполнения (Ctrl+C)\nЗавершение программы...\n".encode("utf-8")
+
 # ============================================================================
 # ПРЕДОПРЕДЕЛЕННЫЕ КОНФИГУРАЦИИ ТЕСТОВ
 # ============================================================================
-TEST_CONFIGS = {
+TEST_CONFIGS = MappingProxyType({
     "quick": {
         "test_type": "basic",
         "load_type": "CPU",
@@ -240,14 +431,34 @@ TEST_CONFIGS = {
         "complexity": "hard",
         "performance_mode": True
     }
-}
+})
+
+# Конфигурация, используемая при неизвестном имени конфигурации
+DEFAULT_TEST_CONFIG = TEST_CONFIGS["quick"]
 
 # ============================================================================
 # ГЛОБАЛЬНЫЕ ПЕРЕМЕННЫЕ
 # ============================================================================
-interrupt_flag = False
+# Событие остановки теста: устанавливается по Ctrl+C, по истечении времени теста
+# или после завершения тестовой функции; тестовые функции проверяют его между блоками.
+# Событие multiprocessing разделяется с процессами пула параллельных тестов
+# Процессы пула запускаются методом spawn на всех платформах: fork при работающих
+# потоках мониторинга и записи лога может унаследовать захваченную блокировку
+process_context = multiprocessing.get_context("spawn")
+stop_event = process_context.Event()
+
+# Время запуска программы: от него строятся имена файлов логов
+program_start_datetime = datetime.now()
+
+# Накопители мониторинга по столбцам: {"count", "total", "peak"} (заполняются в monitor_system_resources)
 monitoring_data = {}
 
+# Столбцы мониторинга (ключи monitoring_data)
+MONITORING_COLUMNS = ("cpu", "mem", "cpu_temp", "gpu_temp")
+
+# Фоновый поток записи лога в файл (QueueListener), создается в setup_logging
+log_listener: Optional[logging.handlers.QueueListener] = None
+
 # Переменные для отслеживания результатов расчетов
 calculation_results = {
     "iterations_completed": 0,
@@ -260,62 +471,113 @@ calculation_results = {
 # ФУНКЦИИ ДЛЯ РАБОТЫ С ФАЙЛОВОЙ СИСТЕМОЙ
 # ============================================================================
 
-def get_file_path(category: str, file_type: str, **kwargs) -> str:
+@functools.lru_cache(maxsize=1)
+def compile_path_resolvers() -> Dict[tuple, Callable[..., str]]:
+    """
+    Обходит FILE_SYSTEM_CONFIG и строит функции путей к файлам.
+    Каталог, префикс, уровень и расширение подставляются в шаблон имени
+    заранее; функции для (category, file_type) остается один вызов strftime.
+    Словарь строится при первом вызове (из get_file_path) и затем переиспользуется.
+    """
+    name_formats = {
+        "logs": FILE_SYSTEM_CONFIG["file_naming"]["log_format"],
+        "output": FILE_SYSTEM_CONFIG["file_naming"]["results_format"]
+    }
+    resolvers = {}
+    for category, subdir_config in FILE_SYSTEM_CONFIG["subdirectories"].items():
+        if category not in name_formats:
+            continue
+        directory = DIRECTORY_PATHS[category]
+        for file_type, file_pattern in subdir_config["file_patterns"].items():
+            # В шаблоне остаются только поля, зависящие от вызова: дата и тип теста
+            filename_template = name_formats[category].format(
+                prefix=file_pattern["prefix"],
+                level=file_pattern.get("level", ""),
+                test_type="{test_type}",
+                date="{date}",
+                extension=file_pattern["extension"]
+            )
+            
+            def resolve(now: datetime, test_type: str = "unknown",
+                        directory: str = directory, filename_template: str = filename_template,
+                        date_format: str = file_pattern["date_format"]) -> str:
+                filename = filename_template.format(date=now.strftime(date_format), test_type=test_type)
+                return os.path.join(directory, filename)
+            
+            resolvers[(category, file_type)] = resolve
+    return resolvers
+
+
+def get_file_path(category: str, file_type: str, now: Optional[datetime] = None, **kwargs) -> str:
     """
     Генерирует путь к файлу на основе структурированной конфигурации.
     category: 'logs' или 'output'. file_type: 'info', 'debug', 'results'.
     Дополнительные параметры (например, test_type) подставляются в шаблон имени.
+    Имена логов строятся от времени запуска программы, результатов — от текущего
+    времени или от переданного now (чтобы вызывающий код не читал часы повторно).
+    Каталог файла создается при необходимости (ensure_directory).
     """
     try:
-        base_path = FILE_SYSTEM_CONFIG["base_path"]
-        subdir_config = FILE_SYSTEM_CONFIG["subdirectories"][category]
-        subdir_name = subdir_config["name"]
-        file_pattern = subdir_config["file_patterns"][file_type]
-        # Формируем имя файла по шаблону
-        if category == "logs":
-            date_str = datetime.now().strftime(file_pattern["date_format"])
-            filename = FILE_SYSTEM_CONFIG["file_naming"]["log_format"].format(
-                prefix=file_pattern["prefix"],
-                level=file_pattern["level"],
-                date=date_str,
-                extension=file_pattern["extension"]
-            )
-        elif category == "output":
-            date_str = datetime.now().strftime(file_pattern["date_format"])
-            test_type = kwargs.get("test_type", "unknown")
-            filename = FILE_SYSTEM_CONFIG["file_naming"]["results_format"].format(
-                prefix=file_pattern["prefix"],
-                test_type=test_type,
-                date=date_str,
-                extension=file_pattern["extension"]
-            )
-        else:
-            raise ValueError(f"Неизвестная категория: {category}")
-        return os.path.join(base_path, subdir_name, filename)
+        resolve = compile_path_resolvers()[(category, file_type)]
     except KeyError as e:
         raise ValueError(f"Ошибка конфигурации файловой системы: {e}")
+    ensure_directory(DIRECTORY_PATHS[category])
+    if now is None:
+        now = program_start_datetime if category == "logs" else datetime.now()
+    return resolve(now, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_directory(path: str) -> str:
+    """
+    Создает каталог path (вместе с родительскими), если его нет, и возвращает path.
+    Для каждого пути os.makedirs вызывается один раз за время работы процесса;
+    каталог, удаленный во время работы, повторно не создается.
+    """
+    os.makedirs(path, exist_ok=True)
+    return path
 
 
 def setup_directories() -> None:
     """
     Создает необходимые директории для логов и выходных данных.
-    Использует структуру FILE_SYSTEM_CONFIG.
+    Пути берутся из DIRECTORY_PATHS (построены по FILE_SYSTEM_CONFIG).
     """
     try:
-        base_path = FILE_SYSTEM_CONFIG["base_path"]
-        for category, config in FILE_SYSTEM_CONFIG["subdirectories"].items():
-            subdir_path = os.path.join(base_path, config["name"])
-            os.makedirs(subdir_path, exist_ok=True)
+        for subdir_path in DIRECTORY_PATHS.values():
+            ensure_directory(subdir_path)
     except Exception as e:
         print(f"Ошибка создания директорий: {e}")
         sys.exit(1)
 
 
+def stop_log_listener() -> None:
+    """
+    Останавливает фоновую запись лога: дожидается записи всех сообщений
+    из очереди в файл. Повторный вызов ничего не делает.
+    """
+    global log_listener
+    if log_listener is not None:
+        log_listener.stop()
+        log_listener = None
+
+
+# Очередь лога дописывается в файл при выходе из программы; обработчик
+# регистрируется один раз, а не при каждом вызове setup_logging
+atexit.register(stop_log_listener)
+
+
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """
     Настраивает систему логирования: файл + консоль.
     Имя файла и путь берутся из FILE_SYSTEM_CONFIG.
+    Запись в файл вынесена в фоновый поток: логгер кладет сообщения в очередь
+    (QueueHandler), а QueueListener пишет их в файл, не задерживая тест.
+    Консоль обслуживается синхронно, чтобы строки лога не перемешивались с print.
+    Очередь дописывается в файл при выходе из программы (stop_log_listener,
+    зарегистрирован в atexit один раз при импорте).
     """
+    global log_listener
     log_path = get_file_path("logs", log_level.lower())
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
     file_handler = logging.FileHandler(log_path, mode='a', encoding='utf-8')
@@ -327,16 +589,23 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     # Удаляем старые обработчики, чтобы не было дублирования
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
-    logger.addHandler(file_handler)
+    stop_log_listener()
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    log_listener.start()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     logger.addHandler(console_handler)
     return logger
 
 
-def get_system_info() -> Dict[str, str]:
+@functools.lru_cache(maxsize=1)
+def get_system_info() -> MappingProxyType:
     """
     Получает информацию о системе: ОС, версия, процессор, архитектура, тип процессора, версия Python.
+    Значения не меняются за время работы процесса, поэтому платформа опрашивается
+    один раз (platform.processor()/version() могут запускать внешние команды);
+    возвращается неизменяемый словарь, общий для всех вызовов.
     """
-    import platform
     os_name = platform.system()
     os_version = platform.version()
     processor = platform.processor() or platform.machine()
@@ -347,320 +616,853 @@ def get_system_info() -> Dict[str, str]:
         processor_type = 'M'
     else:
         processor_type = 'X86'
-    return {
+    return MappingProxyType({
         "os_name": os_name,
         "os_version": os_version,
         "processor": processor,
         "architecture": architecture,
         "processor_type": processor_type,
         "python_version": python_version
-    }
+    })
 
 
-def monitor_system_resources() -> Dict[str, float]:
+def detect_temperature_sensors() -> Dict[str, Any]:
     """
-    Мониторит загрузку CPU, RAM и температуру (если доступно).
-    Возвращает словарь со средними и пиковыми значениями.
+    Однократно определяет доступные датчики температуры.
+    Возвращает ключи датчиков CPU и GPU в psutil.sensors_temperatures() (или None).
+    На macOS и Windows psutil не предоставляет sensors_temperatures — оба ключа None.
     """
-    cpu_usages = []
-    mem_usages = []
-    cpu_temps = []
-    gpu_temps = []
-    start_time = time.time()
-    while not interrupt_flag:
-        cpu = psutil.cpu_percent(interval=None)
-        mem = psutil.virtual_memory().percent
-        cpu_usages.append(cpu)
-        mem_usages.append(mem)
-        # Температура CPU (если доступно)
+    sensors = {"cpu": None, "gpu": None}
+    read_temperatures = getattr(psutil, "sensors_temperatures", None)
+    if read_temperatures is None:
+        return sensors
+    try:
+        temps = read_temperatures()
+    except Exception:
+        return sensors
+    for key in ("coretemp", "cpu-thermal"):
+        if key in temps:
+            sensors["cpu"] = key
+            break
+    if "amdgpu" in temps:
+        sensors["gpu"] = "amdgpu"
+    return sensors
+
+
+def open_hwmon_inputs(sensor_name: Optional[str]) -> list:
+    """
+    Открывает файлы temp*_input датчика sensor_name в каталоге hwmon (Linux)
+    и возвращает их дескрипторы. Это те же файлы, из которых
+    psutil.sensors_temperatures() строит записи датчика, но без повторного
+    обхода всех каталогов hwmon на каждом замере. Если каталога или датчика
+    нет (macOS, Windows), возвращает пустой список.
+    """
+    descriptors = []
+    if sensor_name is None:
+        return descriptors
+    hwmon_path = TEST_SETTINGS["hwmon_path"]
+    try:
+        chips = sorted(os.listdir(hwmon_path))
+    except OSError:
+        return descriptors
+    for chip in chips:
+        chip_path = os.path.join(hwmon_path, chip)
+        try:
+            with open(os.path.join(chip_path, "name"), encoding="utf-8") as f:
+                if f.read().strip() != sensor_name:
+                    continue
+            for entry in sorted(os.listdir(chip_path)):
+                if entry.startswith("temp") and entry.endswith("_input"):
+                    descriptors.append(os.open(os.path.join(chip_path, entry), os.O_RDONLY))
+        except OSError:
+            continue
+    return descriptors
+
+
+def read_hwmon_average(descriptors: list) -> Optional[float]:
+    """
+    Читает открытые файлы temp*_input (миллиградусы) с начала через os.pread
+    и возвращает среднюю температуру в °C или None, если ни один не прочитан.
+    """
+    total = 0.0
+    count = 0
+    for fd in descriptors:
         try:
-            temps = psutil.sensors_temperatures()
-            if 'coretemp' in temps:
-                cpu_temps.append(np.mean([t.current for t in temps['coretemp']]))
-            elif 'cpu-thermal' in temps:
-                cpu_temps.append(np.mean([t.current for t in temps['cpu-thermal']]))
-            # Температура GPU (если доступно)
-            if 'amdgpu' in temps:
-                gpu_temps.append(np.mean([t.current for t in temps['amdgpu']]))
-        except Exception:
+            total += int(os.pread(fd, 32, 0)) / 1000.0
+            count += 1
+        except (OSError, ValueError):
             pass
-        time.sleep(TEST_SETTINGS["monitoring_interval"])
-        if time.time() - start_time > TEST_SETTINGS["max_duration"]:
-            break
-    # Сохраняем данные мониторинга
-    monitoring_data["cpu"] = cpu_usages
-    monitoring_data["mem"] = mem_usages
-    monitoring_data["cpu_temp"] = cpu_temps
-    monitoring_data["gpu_temp"] = gpu_temps
-    return monitoring_data
+    return total / count if count else None
 
 
-def start_monitoring(duration: float, logger: logging.Logger) -> None:
+def average_current(entries: list) -> float:
     """
-    Запускает мониторинг ресурсов в отдельном потоке на время теста.
+    Средняя температура по записям датчика psutil (поле current).
+    Считается простым циклом, без промежуточных списков и вызова np.mean,
+    фиксированные накладные расходы которого велики для нескольких значений.
     """
-    def monitor_loop():
-        monitor_system_resources()
-    t = threading.Thread(target=monitor_loop)
-    t.daemon = True
-    t.start()
-    logger.debug("Мониторинг ресурсов запущен")
-    time.sleep(duration)
-    global interrupt_flag
-    interrupt_flag = True
-    t.join()
-    logger.debug("Мониторинг ресурсов завершен")
+    count = len(entries)
+    if not count:
+        return 0.0
+    total = 0.0
+    for entry in entries:
+        total += entry.current
+    return total / count
 
 
-def start_monitoring_performance(logger: logging.Logger) -> None:
+def monitor_system_resources(duration: Optional[float] = None) -> Dict[str, Dict[str, float]]:
     """
-    Запускает мониторинг ресурсов в режиме производительности (до завершения теста).
+    Мониторит загрузку CPU, RAM и температуру (если доступно) до установки stop_event.
+    Если задана duration (обычный режим), по ее истечении сам устанавливает
+    stop_event, завершая тест; в режиме производительности duration=None.
+    Замер снимается после каждого интервала ожидания и один раз после установки
+    stop_event (последний неполный интервал). Замеры не хранятся: для каждого столбца MONITORING_COLUMNS накапливаются
+    количество, сумма и пик, поэтому память не растет с длительностью теста,
+    а analyze_results получает итоги за O(1). Датчики температуры определяются один раз;
+    в Linux их файлы в hwmon открываются заранее и читаются напрямую,
+    psutil.sensors_temperatures() опрашивается только если файлы не найдены.
+    Возвращает monitoring_data — словарь накопителей по столбцам.
     """
-    def monitor_loop():
-        monitor_system_resources()
-    t = threading.Thread(target=monitor_loop)
-    t.daemon = True
-    t.start()
-    logger.debug("Мониторинг ресурсов (режим производительности) запущен")
-    # Ждем завершения теста (interrupt_flag установится в основном потоке)
-    while not interrupt_flag:
-        time.sleep(0.1)
-    t.join()
-    logger.debug("Мониторинг ресурсов (режим производительности) завершен")
+    # Первый вызов cpu_percent(interval=None) только запоминает точку отсчета
+    # (возвращает 0.0); psutil хранит ее отдельно для каждого потока, поэтому
+    # вызов делается здесь, в потоке мониторинга, до подготовки датчиков
+    psutil.cpu_percent(interval=None)
+    interval = TEST_SETTINGS["monitoring_interval"]
+    for column in MONITORING_COLUMNS:
+        monitoring_data[column] = {"count": 0, "total": 0.0, "peak": 0.0}
+    cpu_stats, mem_stats, cpu_temp_stats, gpu_temp_stats = (monitoring_data[column] for column in MONITORING_COLUMNS)
+    
+    def add_sample(stats: Dict[str, float], value: float) -> None:
+        stats["count"] += 1
+        stats["total"] += value
+        if value > stats["peak"]:
+            stats["peak"] = value
+    
+    sensors = detect_temperature_sensors()
+    cpu_key = sensors["cpu"]
+    gpu_key = sensors["gpu"]
+    cpu_descriptors = open_hwmon_inputs(cpu_key)
+    gpu_descriptors = open_hwmon_inputs(gpu_key)
+    # Полный опрос psutil нужен, только если найденный датчик не удалось открыть напрямую
+    needs_psutil = (cpu_key and not cpu_descriptors) or (gpu_key and not gpu_descriptors)
+    read_temperatures = psutil.sensors_temperatures if needs_psutil else None
+    
+    def take_sample() -> None:
+        add_sample(cpu_stats, psutil.cpu_percent(interval=None))
+        add_sample(mem_stats, psutil.virtual_memory().percent)
+        # Температура CPU/GPU (только если датчики найдены при запуске)
+        if cpu_descriptors:
+            temperature = read_hwmon_average(cpu_descriptors)
+            if temperature is not None:
+                add_sample(cpu_temp_stats, temperature)
+        if gpu_descriptors:
+            temperature = read_hwmon_average(gpu_descriptors)
+            if temperature is not None:
+                add_sample(gpu_temp_stats, temperature)
+        if read_temperatures is not None:
+            try:
+                temps = read_temperatures()
+                cpu_entries = None if cpu_descriptors else temps.get(cpu_key)
+                if cpu_entries:
+                    add_sample(cpu_temp_stats, average_current(cpu_entries))
+                gpu_entries = None if gpu_descriptors else temps.get(gpu_key)
+                if gpu_entries:
+                    add_sample(gpu_temp_stats, average_current(gpu_entries))
+            except Exception:
+                pass
+    
+    start_time = time.time()
+    while True:
+        # Ожидание следующего замера прерывается сразу при установке stop_event
+        # (завершение теста или Ctrl+C); после этого снимается последний замер,
+        # поэтому даже короткий тест получает данные за фактическое время работы
+        stopped = stop_event.wait(interval)
+        take_sample()
+        if stopped:
+            break
+        elapsed = time.time() - start_time
+        if duration is not None and elapsed >= duration:
+            # Время теста истекло — сигнализируем тестовой функции о завершении
+            stop_event.set()
+            break
+        if elapsed > TEST_SETTINGS["max_duration"]:
+            break
+    for fd in cpu_descriptors + gpu_descriptors:
+        os.close(fd)
+    return monitoring_data
 
 
 # ============================================================================
 # ФУНКЦИИ ТЕСТИРОВАНИЯ
 # ============================================================================
 
+def create_rng(*streams: int) -> "np.random.Generator":
+    """
+    Создает генератор случайных чисел NumPy (PCG64) для тестовых нагрузок.
+    Зерно берется из TEST_SETTINGS["random_seed"], что позволяет получать
+    одинаковые входные данные при сравнении разных систем. streams — номера
+    потока данных (например, вид данных и номер блока): при заданном зерне
+    генератор засевается [seed, *streams], и разные потоки не совпадают.
+    """
+    seed = TEST_SETTINGS["random_seed"]
+    if seed is not None and streams:
+        seed = [seed, *streams]
+    return np.random.default_rng(seed)
+
+
+def block_random_source(stream: int, generate: Callable[["np.random.Generator", int], Any]) -> Callable[[int, int, Any], None]:
+    """
+    Возвращает функцию fill(lo, hi, out), записывающую в out[:hi - lo] случайные
+    данные элементов с глобальными номерами [lo, hi).
+    Диапазон разбит на блоки фиксированного размера BATCH_SETTINGS["random_block_size"];
+    блок номер b генерируется целиком вызовом generate(create_rng(stream, b), размер),
+    поэтому при заданном зерне данные элемента не зависят от того, какой задаче
+    пула и какому пакету он достался, а значит и от числа процессов.
+    Последний сгенерированный блок запоминается для следующих пакетов.
+    """
+    block_size = BATCH_SETTINGS["random_block_size"]
+    current_block = -1
+    values = None
+    
+    def fill(lo: int, hi: int, out: Any) -> None:
+        nonlocal current_block, values
+        pos = lo
+        while pos < hi:
+            block, offset = divmod(pos, block_size)
+            if block != current_block:
+                values = generate(create_rng(stream, block), block_size)
+                current_block = block
+            end = min(hi, pos - offset + block_size)
+            out[pos - lo:end - lo] = values[offset:offset + end - pos]
+            pos = end
+    
+    return fill
+
+
+def init_worker(event: Any, random_seed: Optional[int]) -> None:
+    """
+    Инициализирует процесс пула ProcessPoolExecutor.
+    Подключает общее событие остановки и зерно ГСЧ родительского процесса
+    и отключает SIGINT: Ctrl+C обрабатывает родитель, устанавливая stop_event.
+    """
+    global stop_event
+    stop_event = event
+    TEST_SETTINGS["random_seed"] = random_seed
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def get_worker_count() -> int:
+    """
+    Возвращает количество процессов для параллельных тестов:
+    TEST_SETTINGS["workers"] или число логических ядер CPU.
+    В Windows значение ограничивается WINDOWS_MAX_WORKERS (в том числе
+    явно заданное), иначе ProcessPoolExecutor не создается.
+    """
+    workers = TEST_SETTINGS["workers"] or os.cpu_count() or 1
+    if sys.platform == "win32":
+        workers = min(workers, WINDOWS_MAX_WORKERS)
+    return workers
+
+
+def run_chunked(kernel: Callable[[int, int], Any], total: int, chunk_size: int,
+                logger: Optional[logging.Logger] = None, message_key: Optional[str] = None,
+                format_result: Optional[Callable[[Any], Any]] = None, start: int = 0) -> int:
+    """
+    Выполняет kernel(lo, hi) последовательными блоками по диапазону [start, total).
+    Ядро — тесный цикл без логирования и проверок прерывания; stop_event
+    проверяется только между блоками, а прогресс пишется в DEBUG-лог раз в 10%
+    диапазона по шаблону LOG_MESSAGES[message_key] (done, total, result — то,
+    что вернуло ядро). format_result, если задан, преобразует результат ядра
+    только при записи в лог. Без logger (в процессах пула) или если уровень
+    DEBUG отключен, прогресс не пишется и результат не преобразуется.
+    Возвращает количество обработанных элементов.
+    """
+    count = total - start
+    log_progress = logger is not None and logger.isEnabledFor(logging.DEBUG)
+    log_step = max(1, count // 10)
+    next_log = log_step
+    done = 0
+    for lo in range(start, total, chunk_size):
+        if stop_event.is_set():
+            break
+        hi = min(lo + chunk_size, total)
+        result = kernel(lo, hi)
+        done = hi - start
+        if log_progress and (done >= next_log or done == count):
+            if format_result is not None:
+                result = format_result(result)
+            logger.debug(LOG_MESSAGES[message_key], {"done": done, "total": count, "result": result})
+            next_log = (done // log_step + 1) * log_step
+    return done
+
+
+def run_parallel(kernel: Callable[[int, int], tuple], total: int, logger: logging.Logger,
+                 message_key: str, on_result: Optional[Callable[[int, Any], Any]] = None,
+                 format_result: Optional[Callable[[Any], Any]] = None) -> int:
+    """
+    Распределяет диапазон [0, total) по процессам ProcessPoolExecutor.
+    Диапазон делится на get_worker_count() * BATCH_SETTINGS["parallel_tasks_per_worker"]
+    непересекающихся частей; kernel(lo, hi) должна быть функцией уровня модуля
+    и возвращать (обработано элементов, результат).
+    Результаты задач обрабатываются в родительском процессе по мере готовности:
+    on_result(processed, result) (если задан) сворачивает их, а его значение попадает
+    в лог прогресса вместо результата задачи (лог пишется только при включенном DEBUG).
+    После установки stop_event еще не начатые задачи отменяются, а запущенные
+    завершают текущий блок и возвращают частичный результат со своим счетчиком.
+    Мониторинг остается в родительском процессе.
+    Возвращает количество фактически обработанных элементов.
+    """
+    workers = get_worker_count()
+    tasks = max(1, min(total, workers * BATCH_SETTINGS["parallel_tasks_per_worker"]))
+    bounds = [total * k // tasks for k in range(tasks + 1)]
+    log_progress = logger.isEnabledFor(logging.DEBUG)
+    log_step = max(1, total // 10)
+    next_log = log_step
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers, mp_context=process_context, initializer=init_worker,
+                             initargs=(stop_event, TEST_SETTINGS["random_seed"])) as executor:
+        futures = [executor.submit(kernel, lo, hi) for lo, hi in zip(bounds, bounds[1:])]
+        cancelled = False
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            if not cancelled and stop_event.is_set():
+                for pending in futures:
+                    pending.cancel()
+                cancelled = True
+            processed, result = future.result()
+            done += processed
+            if on_result is not None:
+                result = on_result(processed, result)
+            if log_progress and (done >= next_log or done == total):
+                if format_result is not None:
+                    result = format_result(result)
+                logger.debug(LOG_MESSAGES[message_key], {"done": done, "total": total, "result": result})
+                next_log = (done // log_step + 1) * log_step
+    return done
+
+
+def basic_kernel(start: int, stop: int) -> int:
+    """
+    Вычислительное ядро базового теста для диапазона [start, stop).
+    Весь блок обрабатывается векторно в одном массиве int64 (операции на месте,
+    без промежуточных копий); возвращает свертку результатов (XOR), чтобы
+    вычисления не были отброшены.
+    """
+    values = np.arange(start, stop, dtype=np.int64)
+    values *= 2
+    values += 1
+    np.multiply(values, values, out=values)
+    np.remainder(values, 1000000, out=values)
+    return int(np.bitwise_xor.reduce(values))
+
+
 def basic_performance_test(complexity: str, logger: logging.Logger) -> None:
     """
     Базовое тестирование производительности.
     Выполняет простые математические операции для нагрузки CPU.
+    Диапазон итераций обрабатывается блоками через basic_kernel.
     """
     iterations = COMPLEXITY_SETTINGS["hash_calculation"][complexity]
-    for i in range(iterations):
-        if interrupt_flag:
-            break
-        result = i * 2 + 1
-        result = result ** 2
-        result = result % 1000000
-        if i % (iterations // 10) == 0:
-            logger.debug(f"Базовый тест: {i}/{iterations}")
+    run_chunked(basic_kernel, iterations, BATCH_SETTINGS["basic_chunk_size"], logger, "progress_basic")
+
+
+def hash_range(start: int, stop: int) -> tuple:
+    """
+    Хеширует записи с номерами [start, stop) в процессе пула.
+    Записи фиксированной ширины (префикс + номер + случайный суффикс) лежат
+    в одном непрерывном буфере, и весь пакет передается в sha256().update()
+    одним вызовом. Суффиксы берутся из block_random_source, поэтому при заданном
+    зерне данные записи не зависят от числа процессов.
+    Возвращает (записей обработано, дайджест последнего пакета).
+    """
+    batch_size = BATCH_SETTINGS["hash_batch_size"]
+    # Буфер записей: поля лежат подряд, поэтому массив отдается в hashlib без копирования
+    records = np.empty(batch_size, dtype=[("prefix", "S10"), ("index", "<u8"), ("suffix", "<u8")])
+    records["prefix"] = BATCH_SETTINGS["hash_record_prefix"]
+    offsets = np.arange(batch_size, dtype=np.uint64)
+    # Случайные суффиксы генерируются крупными блоками, не зависящими от границ задач
+    fill_suffixes = block_random_source(
+        1, lambda block_rng, size: block_rng.integers(1, 1_000_000, size=size, dtype=np.uint64)
+    )
+    digest = b""
+    
+    def hash_batch(lo: int, hi: int) -> None:
+        nonlocal digest
+        count = hi - lo
+        batch = records[:count]
+        np.add(offsets[:count], np.uint64(lo), out=batch["index"])
+        fill_suffixes(lo, hi, batch["suffix"])
+        hasher = hashlib.sha256()
+        hasher.update(batch)
+        digest = hasher.digest()
+    
+    done = run_chunked(hash_batch, stop, batch_size, start=start)
+    return done, digest
 
 
 def hash_calculation_test(complexity: str, logger: logging.Logger) -> None:
     """
     Тест расчета хешей SHA-256.
-    Генерирует случайные данные и рассчитывает хеш.
+    Диапазон записей делится между процессами пула (hash_range);
+    прерывание проверяется на границе пакета.
     """
     iterations = COMPLEXITY_SETTINGS["hash_calculation"][complexity]
-    for i in range(iterations):
-        if interrupt_flag:
-            break
-        data = f"test_data_{i}_{random.randint(1, 1000000)}".encode('utf-8')
-        hash_result = hashlib.sha256(data).hexdigest()
-        if i % (iterations // 10) == 0:
-            logger.debug(f"Хеш: {i}/{iterations}, Результат: {hash_result[:16]}...")
+    # Дайджест переводится в hex только для строки лога
+    run_parallel(hash_range, iterations, logger, "progress_hash",
+                 format_result=lambda digest: digest[:8].hex())
+
+
+def mine_range(start: int, stop: int, log_blocks: bool = False) -> tuple:
+    """
+    Перебирает nonce из [start, stop) в процессе пула.
+    Состояние SHA-256 после постоянного префикса заголовка считается один раз
+    (midstate); для каждого nonce копируется состояние и дописываются 8 байт nonce.
+    Возвращает (хешей посчитано, (блоков найдено, [(nonce, начало хеша)] при log_blocks)).
+    """
+    base_hasher = hashlib.sha256(BATCH_SETTINGS["mining_block_prefix"])
+    blocks_found = 0
+    found = []
+    
+    def mine_chunk(lo: int, hi: int) -> None:
+        nonlocal blocks_found
+        for nonce in range(lo, hi):
+            hasher = base_hasher.copy()
+            hasher.update(nonce.to_bytes(8, 'little'))
+            digest = hasher.digest()
+            # Первый байт дайджеста 0x00 эквивалентен префиксу '00' в hex-строке
+            if digest[0] == 0:
+                blocks_found += 1
+                if log_blocks:
+                    found.append((nonce, digest[:8]))
+    
+    hashes = run_chunked(mine_chunk, stop, BATCH_SETTINGS["mining_chunk_size"], start=start)
+    return hashes, (blocks_found, found)
 
 
 def bitcoin_mining_simulation(complexity: str, logger: logging.Logger) -> None:
     """
     Симуляция майнинга биткойна.
     Имитирует поиск хеша с определенным количеством нулей.
+    Диапазон nonce делится между процессами пула (mine_range); счетчики
+    calculation_results обновляются в родительском процессе по мере готовности задач.
     """
     global calculation_results
     iterations = COMPLEXITY_SETTINGS["bitcoin_mining"][complexity]
     calculation_results["iterations_completed"] = 0
     calculation_results["calculations_performed"] = 0
     calculation_results["test_specific_results"] = {"hashes_calculated": 0, "blocks_found": 0}
+    specific_results = calculation_results["test_specific_results"]
+    log_blocks = logger.isEnabledFor(logging.DEBUG)
     
-    for i in range(iterations):
-        if interrupt_flag:
-            break
-        nonce = i
-        data = f"block_data_{nonce}".encode('utf-8')
-        hash_result = hashlib.sha256(data).hexdigest()
-        
-        calculation_results["iterations_completed"] = i + 1
-        calculation_results["calculations_performed"] += 1
-        calculation_results["test_specific_results"]["hashes_calculated"] += 1
-        
-        if hash_result.startswith('00'):
-            calculation_results["test_specific_results"]["blocks_found"] += 1
-            logger.debug(f"Найден блок! Nonce: {nonce}, Hash: {hash_result[:16]}...")
-        if i % (iterations // 10) == 0:
-            logger.debug(f"Майнинг: {i}/{iterations}")
+    def add_result(hashes: int, result: tuple) -> int:
+        blocks_found, found = result
+        for nonce, digest in found:
+            logger.debug(f"Найден блок! Nonce: {nonce}, Hash: {digest.hex()}...")
+        calculation_results["iterations_completed"] += hashes
+        calculation_results["calculations_performed"] += hashes
+        specific_results["hashes_calculated"] += hashes
+        specific_results["blocks_found"] += blocks_found
+        return specific_results["blocks_found"]
+    
+    run_parallel(functools.partial(mine_range, log_blocks=log_blocks), iterations,
+                 logger, "progress_mining", on_result=add_result)
+
+
+def get_blas_backend() -> str:
+    """
+    Возвращает имя библиотеки BLAS, с которой собран NumPy (MKL, Accelerate, OpenBLAS).
+    Для старых версий NumPy без show_config(mode="dicts") возвращает 'unknown'.
+    """
+    try:
+        return np.show_config(mode="dicts")["Build Dependencies"]["blas"]["name"]
+    except (TypeError, KeyError):
+        return "unknown"
 
 
 def matrix_operations_test(complexity: str, logger: logging.Logger) -> None:
     """
     Тест операций с матрицами.
-    Создает матрицы, выполняет умножение, обращение и нахождение собственных значений.
+    Создает стек из нескольких пар матриц float32 и обрабатывает его пакетно:
+    одно умножение np.matmul на весь стек в заранее выделенный буфер,
+    пакетное обращение и пакетное LU-разложение (np.linalg.slogdet).
+    Прерывание проверяется между этапами.
     """
     size = COMPLEXITY_SETTINGS["matrix_operations"][complexity]
-    for i in range(10):  # 10 итераций для стабильной нагрузки
-        if interrupt_flag:
-            break
-        # Создание случайных матриц
-        matrix_a = np.random.rand(size, size)
-        matrix_b = np.random.rand(size, size)
-        
-        # Матричное умножение
-        result = np.dot(matrix_a, matrix_b)
-        
-        # Обращение матрицы
-        try:
-            inverse = np.linalg.inv(matrix_a)
-        except np.linalg.LinAlgError:
-            inverse = np.eye(size)
-        
-        # Собственные значения
-        eigenvalues = np.linalg.eigvals(matrix_a)
-        
-        logger.debug(f"Матрицы: {i+1}/10, Размер: {size}x{size}")
+    batch = BATCH_SETTINGS["matrix_batch_count"]
+    rng = create_rng()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Матрицы: BLAS {get_blas_backend()}, стек {batch}x{size}x{size}")
+    
+    # Стеки матриц и буфер результата выделяются один раз (float32 — вдвое меньше трафика памяти)
+    matrix_a = np.empty((batch, size, size), dtype=np.float32)
+    matrix_b = np.empty_like(matrix_a)
+    result = np.empty_like(matrix_a)
+    rng.standard_normal(dtype=np.float32, out=matrix_a)
+    rng.standard_normal(dtype=np.float32, out=matrix_b)
+    if stop_event.is_set():
+        return
+    
+    # Пакетное матричное умножение — один вызов BLAS на весь стек
+    np.matmul(matrix_a, matrix_b, out=result)
+    if debug:
+        logger.debug(f"Матрицы: умножение {batch}/{batch}, Размер: {size}x{size}")
+    if stop_event.is_set():
+        return
+    
+    # Пакетное обращение матриц (LAPACK getrf/getri)
+    try:
+        inverse = np.linalg.inv(matrix_a)
+    except np.linalg.LinAlgError:
+        inverse = np.broadcast_to(np.eye(size, dtype=np.float32), matrix_a.shape)
+    if debug:
+        logger.debug(f"Матрицы: обращение {batch}/{batch}, Размер: {size}x{size}")
+    if stop_event.is_set():
+        return
+    
+    # LU-разложение всего стека одним вызовом (LAPACK getrf) вместо собственных значений
+    sign, logdet = np.linalg.slogdet(matrix_a)
+    if debug:
+        logger.debug(f"Матрицы: LU-разложение {batch}/{batch}, Размер: {size}x{size}")
+
+
+@functools.lru_cache(maxsize=1)
+def gpu_available() -> bool:
+    """
+    Проверяет один раз, доступна ли видеокарта CUDA через CuPy.
+    Возвращает False, если CuPy не установлен или устройства не найдены.
+    """
+    if cp is None:
+        return False
+    try:
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def matrix_operations_test_gpu(complexity: str, logger: logging.Logger) -> None:
+    """
+    Тест операций с матрицами на видеокарте (CuPy, cuBLAS/cuSOLVER).
+    Повторяет matrix_operations_test: стек пар матриц float32 выделяется
+    на устройстве один раз, затем пакетное умножение, обращение и LU-разложение.
+    После каждого этапа выполняется синхронизация устройства, прерывание
+    проверяется между этапами.
+    """
+    size = COMPLEXITY_SETTINGS["matrix_operations"][complexity]
+    batch = BATCH_SETTINGS["matrix_batch_count"]
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Матрицы (GPU): стек {batch}x{size}x{size}")
+    
+    # Стеки матриц и буфер результата выделяются на устройстве один раз
+    matrix_a = cp.random.standard_normal((batch, size, size), dtype=cp.float32)
+    matrix_b = cp.random.standard_normal((batch, size, size), dtype=cp.float32)
+    result = cp.empty((batch, size, size), dtype=cp.float32)
+    cp.cuda.runtime.deviceSynchronize()
+    if stop_event.is_set():
+        return
+    
+    # Пакетное матричное умножение — один вызов cuBLAS на весь стек
+    cp.matmul(matrix_a, matrix_b, out=result)
+    cp.cuda.runtime.deviceSynchronize()
+    if debug:
+        logger.debug(f"Матрицы (GPU): умножение {batch}/{batch}, Размер: {size}x{size}")
+    if stop_event.is_set():
+        return
+    
+    # Пакетное обращение матриц
+    inverse = cp.linalg.inv(matrix_a)
+    cp.cuda.runtime.deviceSynchronize()
+    if debug:
+        logger.debug(f"Матрицы (GPU): обращение {batch}/{batch}, Размер: {size}x{size}")
+    
+    if stop_event.is_set():
+        return
+    
+    # LU-разложение всего стека одним вызовом
+    sign, logdet = cp.linalg.slogdet(matrix_a)
+    cp.cuda.runtime.deviceSynchronize()
+    if debug:
+        logger.debug(f"Матрицы (GPU): LU-разложение {batch}/{batch}, Размер: {size}x{size}")
+
+
+def prime_range(start: int, stop: int) -> tuple:
+    """
+    Считает простые числа в диапазоне [start, stop) в процессе пула.
+    Сегментированное решето Эратосфена на массивах NumPy: базовые простые
+    до sqrt(stop) находятся один раз, затем каждый сегмент вычеркивается
+    срезами с шагом p. Сегмент хранит только нечетные числа и помещается
+    в кэш L1/L2. Прерывание проверяется между сегментами.
+    Возвращает (чисел проверено, простых найдено).
+    """
+    if stop <= 2:
+        return stop - start, 0
+    # Базовые простые числа до sqrt(stop) — обычное решето
+    limit = math.isqrt(stop - 1)
+    base_sieve = np.ones(limit + 1, dtype=bool)
+    base_sieve[:2] = False
+    base_sieve[4::2] = False
+    # Четные делители уже вычеркнуты — перебираем только нечетные p с шагом 2p
+    for p in range(3, math.isqrt(limit) + 1, 2):
+        if base_sieve[p]:
+            base_sieve[p * p::2 * p] = False
+    # Четное простое 2 учитывается отдельно, решето работает только с нечетными
+    odd_primes = np.nonzero(base_sieve)[0][1:].tolist()
+    primes_found = 1 if start <= 2 else 0
+    
+    def sieve_segment(low: int, high: int) -> None:
+        nonlocal primes_found
+        first = low | 1  # Первое нечетное число сегмента; элемент k — число first + 2k
+        if first >= high:
+            return
+        segment = np.ones((high - first + 1) // 2, dtype=bool)
+        if first == 1:
+            segment[0] = False  # 1 не является простым
+        for p in odd_primes:
+            if p * p >= high:
+                break
+            # Первое нечетное кратное p в сегменте, но не меньше p*p
+            start_multiple = max(p * p, -(-first // p) * p)
+            if start_multiple % 2 == 0:
+                start_multiple += p
+            segment[(start_multiple - first) // 2::p] = False
+        primes_found += int(np.count_nonzero(segment))
+    
+    done = run_chunked(sieve_segment, stop, 2 * BATCH_SETTINGS["prime_segment_size"], start=start)
+    return done, primes_found
 
 
 def prime_numbers_test(complexity: str, logger: logging.Logger) -> None:
     """
     Тест поиска простых чисел.
-    Ищет простые числа в заданном диапазоне.
+    Считает простые числа в диапазоне [2, max_number): диапазон делится
+    между процессами пула (prime_range), найденные количества суммируются
+    в calculation_results["test_specific_results"]["primes_found"].
     """
+    global calculation_results
     max_number = COMPLEXITY_SETTINGS["prime_numbers"][complexity]
+    calculation_results["test_specific_results"] = {"primes_found": 0}
+    specific_results = calculation_results["test_specific_results"]
     
-    def is_prime(n):
-        if n < 2:
-            return False
-        for i in range(2, int(n ** 0.5) + 1):
-            if n % i == 0:
-                return False
-        return True
-    
-    primes_found = 0
-    for num in range(2, max_number):
-        if interrupt_flag:
-            break
-        if is_prime(num):
-            primes_found += 1
-        if num % (max_number // 10) == 0:
-            logger.debug(f"Простые числа: {num}/{max_number}, Найдено: {primes_found}")
+    def add_count(checked: int, count: int) -> int:
+        specific_results["primes_found"] += count
+        return specific_results["primes_found"]
+    
+    run_parallel(prime_range, max_number, logger, "progress_prime", on_result=add_count)
+
+
+def neural_range(start: int, stop: int) -> tuple:
+    """
+    Обрабатывает примеры [start, stop) в процессе пула.
+    Имитирует прямое и обратное распространение в нейронной сети пакетами:
+    каждый слой — одно матричное умножение float32 на весь пакет
+    в заранее выделенные буферы (out=). Прерывание проверяется между пакетами.
+    Данные примеров берутся из block_random_source (не зависят от числа процессов).
+    Возвращает (примеров обработано, None).
+    """
+    batch_size = BATCH_SETTINGS["neural_batch_size"]
+    input_size = 100
+    hidden_size = 50
+    output_size = 10
+    # Веса одинаковы во всех задачах; данные примеров берутся из блоков с собственным ГСЧ
+    rng = create_rng()
+    fill_inputs = block_random_source(
+        2, lambda block_rng, size: block_rng.standard_normal((size, input_size), dtype=np.float32)
+    )
+    fill_errors = block_random_source(
+        3, lambda block_rng, size: block_rng.standard_normal((size, output_size), dtype=np.float32)
+    )
+    
+    # Создание весов
+    weights1 = rng.standard_normal((input_size, hidden_size), dtype=np.float32) * np.float32(0.01)
+    weights2 = rng.standard_normal((hidden_size, output_size), dtype=np.float32) * np.float32(0.01)
+    weights2_t = np.ascontiguousarray(weights2.T)
+    
+    # Буферы пакета выделяются один раз
+    inputs_buf = np.empty((batch_size, input_size), dtype=np.float32)
+    hidden_buf = np.empty((batch_size, hidden_size), dtype=np.float32)
+    outputs_buf = np.empty((batch_size, output_size), dtype=np.float32)
+    error_buf = np.empty((batch_size, output_size), dtype=np.float32)
+    hidden_error_buf = np.empty((batch_size, hidden_size), dtype=np.float32)
+    
+    def process_batch(lo: int, hi: int) -> None:
+        count = hi - lo
+        inputs = inputs_buf[:count]
+        hidden = hidden_buf[:count]
+        outputs = outputs_buf[:count]
+        output_error = error_buf[:count]
+        
+        # Входные данные
+        fill_inputs(lo, hi, inputs)
+        
+        # Прямое распространение
+        np.tanh(np.matmul(inputs, weights1, out=hidden), out=hidden)
+        np.tanh(np.matmul(hidden, weights2, out=outputs), out=outputs)
+        
+        # Обратное распространение (упрощенное)
+        fill_errors(lo, hi, output_error)
+        np.subtract(outputs, output_error, out=output_error)
+        np.matmul(output_error, weights2_t, out=hidden_error_buf[:count])
+    
+    return run_chunked(process_batch, stop, batch_size, start=start), None
 
 
 def neural_simulation_test(complexity: str, logger: logging.Logger) -> None:
     """
     Симуляция нейронных вычислений.
-    Имитирует прямое и обратное распространение в нейронной сети.
+    Диапазон примеров делится между процессами пула (neural_range).
+    """
+    iterations = COMPLEXITY_SETTINGS["hash_calculation"][complexity]
+    run_parallel(neural_range, iterations, logger, "progress_neural")
+
+
+def neural_simulation_test_gpu(complexity: str, logger: logging.Logger) -> None:
+    """
+    Симуляция нейронных вычислений на видеокарте (CuPy).
+    Повторяет neural_range: пакеты примеров float32 обрабатываются матричными
+    умножениями на устройстве в заранее выделенные буферы (out=).
+    Устройство синхронизируется после каждого пакета, поэтому прерывание
+    и прогресс отражают фактически выполненную работу. Случайные данные пакета
+    генерируются прямо в буферы на устройстве (out=), без новых массивов.
     """
     iterations = COMPLEXITY_SETTINGS["hash_calculation"][complexity]
+    batch_size = BATCH_SETTINGS["neural_batch_size"]
     input_size = 100
     hidden_size = 50
     output_size = 10
+    rng = cp.random.default_rng(TEST_SETTINGS["random_seed"])
     
     # Создание весов
-    weights1 = np.random.randn(input_size, hidden_size) * 0.01
-    weights2 = np.random.randn(hidden_size, output_size) * 0.01
-    
-    for i in range(iterations):
-        if interrupt_flag:
-            break
+    weights1 = rng.standard_normal((input_size, hidden_size), dtype=cp.float32) * cp.float32(0.01)
+    weights2 = rng.standard_normal((hidden_size, output_size), dtype=cp.float32) * cp.float32(0.01)
+    weights2_t = cp.ascontiguousarray(weights2.T)
+    
+    # Буферы пакета выделяются на устройстве один раз
+    inputs_buf = cp.empty((batch_size, input_size), dtype=cp.float32)
+    hidden_buf = cp.empty((batch_size, hidden_size), dtype=cp.float32)
+    outputs_buf = cp.empty((batch_size, output_size), dtype=cp.float32)
+    error_buf = cp.empty((batch_size, output_size), dtype=cp.float32)
+    hidden_error_buf = cp.empty((batch_size, hidden_size), dtype=cp.float32)
+    
+    def process_batch(lo: int, hi: int) -> None:
+        count = hi - lo
+        inputs = inputs_buf[:count]
+        hidden = hidden_buf[:count]
+        outputs = outputs_buf[:count]
+        output_error = error_buf[:count]
+        
         # Входные данные
-        inputs = np.random.randn(input_size)
+        rng.standard_normal(dtype=cp.float32, out=inputs)
         
         # Прямое распространение
-        hidden = np.tanh(np.dot(inputs, weights1))
-        outputs = np.tanh(np.dot(hidden, weights2))
+        cp.tanh(cp.matmul(inputs, weights1, out=hidden), out=hidden)
+        cp.tanh(cp.matmul(hidden, weights2, out=outputs), out=outputs)
         
         # Обратное распространение (упрощенное)
-        output_error = outputs - np.random.randn(output_size)
-        hidden_error = np.dot(output_error, weights2.T)
-        
-        if i % (iterations // 10) == 0:
-            logger.debug(f"Нейронная сеть: {i}/{iterations}")
+        rng.standard_normal(dtype=cp.float32, out=output_error)
+        cp.subtract(outputs, output_error, out=output_error)
+        cp.matmul(output_error, weights2_t, out=hidden_error_buf[:count])
+        cp.cuda.runtime.deviceSynchronize()
+    
+    run_chunked(process_batch, iterations, batch_size, logger, "progress_neural")
 
 
 def cpu_intensive_test(complexity: str, logger: logging.Logger) -> None:
     """
     Интенсивная нагрузка на CPU.
     Выполняет сложные математические вычисления.
+    Итерации блока независимы, поэтому считаются векторно по всему блоку:
+    внутренний цикл из 100 шагов идет по массивам NumPy, а не по скалярам.
     """
     iterations = COMPLEXITY_SETTINGS["hash_calculation"][complexity]
     
-    for i in range(iterations):
-        if interrupt_flag:
-            break
+    def compute_range(start: int, stop: int) -> None:
         # Сложные математические операции
-        x = i * 1.5
-        result = 0
+        x = np.arange(start, stop, dtype=np.float64) * 1.5
+        # tan(x * 0.1) не зависит от j и вычисляется один раз на блок
+        tan_x = np.tan(x * 0.1)
+        result = np.zeros_like(x)
+        term = np.empty_like(x)
         for j in range(100):
-            result += np.sin(x + j) * np.cos(x - j) * np.tan(x * 0.1)
-            result = result ** 0.5 if result > 0 else abs(result) ** 0.5
-        
-        if i % (iterations // 10) == 0:
-            logger.debug(f"CPU интенсивный: {i}/{iterations}")
+            np.sin(x + j, out=term)
+            term *= np.cos(x - j)
+            term *= tan_x
+            result += term
+            # sqrt(|r|) совпадает с r ** 0.5 при r > 0 и abs(r) ** 0.5 иначе
+            np.sqrt(np.abs(result, out=result), out=result)
+    
+    run_chunked(compute_range, iterations, BATCH_SETTINGS["cpu_chunk_size"], logger, "progress_cpu")
 
 
 def memory_intensive_test(complexity: str, logger: logging.Logger) -> None:
     """
     Интенсивная нагрузка на память.
     Создает и обрабатывает большие массивы данных.
+    Массивы выделяются один раз кольцевым буфером из
+    BATCH_SETTINGS["memory_ring_slots"] слотов; на каждой итерации очередной
+    слот перезаполняется случайными числами на месте, без выделения и
+    освобождения памяти. Сумма, среднее и стандартное отклонение считаются
+    за два прохода (сумма и сумма квадратов) без временных массивов.
     """
     iterations = COMPLEXITY_SETTINGS["prime_numbers"][complexity] // 1000
+    rng = create_rng()
+    
+    # Кольцевой буфер больших массивов
+    array_size = BATCH_SETTINGS["memory_array_size"]
+    ring_slots = BATCH_SETTINGS["memory_ring_slots"]
+    data_arrays = [np.empty((array_size, array_size)) for _ in range(ring_slots)]
+    
+    def process_arrays(start: int, stop: int) -> None:
+        for i in range(start, stop):
+            # Перезаполнение очередного массива кольца
+            large_array = data_arrays[i % ring_slots]
+            rng.random(out=large_array)
+            
+            # Операции с массивом
+            flat = large_array.ravel()
+            total = flat.sum()
+            mean = total / flat.size
+            std = math.sqrt(max(float(np.dot(flat, flat)) / flat.size - mean * mean, 0.0))
     
-    # Создание больших массивов
-    array_size = 10000
-    data_arrays = []
-    
-    for i in range(iterations):
-        if interrupt_flag:
-            break
-        # Создание нового большого массива
-        large_array = np.random.rand(array_size, array_size)
-        data_arrays.append(large_array)
-        
-        # Операции с массивом
-        result = np.sum(large_array)
-        result = np.mean(large_array)
-        result = np.std(large_array)
-        
-        # Ограничиваем количество массивов в памяти
-        if len(data_arrays) > 5:
-            data_arrays.pop(0)
-        
-        if i % (iterations // 10) == 0:
-            logger.debug(f"Память интенсивный: {i}/{iterations}")
+    run_chunked(process_arrays, iterations, BATCH_SETTINGS["memory_chunk_size"], logger, "progress_memory")
 
 
 def io_intensive_test(complexity: str, logger: logging.Logger) -> None:
     """
     Интенсивная нагрузка на диск.
     Выполняет множество операций чтения/записи.
+    Файл открывается один раз; за итерацию 1000 случайных чисел float64
+    записываются в начало файла одним вызовом os.write и читаются обратно
+    одним os.read (lseek + write/read вместо pwrite/pread — они есть и в Windows).
     """
     iterations = COMPLEXITY_SETTINGS["hash_calculation"][complexity] // 100
+    rng = create_rng()
     
-    # Создание временного файла
-    temp_file = "temp_io_test.txt"
+    # Создание временного файла (O_BINARY нужен в Windows, на остальных системах равен 0)
+    temp_file = "temp_io_test.bin"
+    fd = os.open(temp_file, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0))
+    values = np.empty(1000, dtype=np.float64)
     
-    try:
-        for i in range(iterations):
-            if interrupt_flag:
-                break
-            
+    def write_and_read(start: int, stop: int) -> None:
+        for i in range(start, stop):
             # Запись данных
-            with open(temp_file, 'w') as f:
-                for j in range(1000):
-                    f.write(f"Строка {j}: {np.random.rand()}\n")
+            rng.random(out=values)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, values)
             
             # Чтение данных
-            with open(temp_file, 'r') as f:
-                lines = f.readlines()
-                # Обработка прочитанных данных
-                sum_values = sum(float(line.split(': ')[1]) for line in lines)
-            
-            if i % (iterations // 10) == 0:
-                logger.debug(f"Диск интенсивный: {i}/{iterations}")
+            os.lseek(fd, 0, os.SEEK_SET)
+            data = os.read(fd, values.nbytes)
+            # Обработка прочитанных данных
+            sum_values = np.frombuffer(data, dtype=np.float64).sum()
+    
+    try:
+        run_chunked(write_and_read, iterations, BATCH_SETTINGS["io_chunk_size"], logger, "progress_io")
     
     finally:
-        # Удаление временного файла
+        # Закрытие и удаление временного файла
+        os.close(fd)
         if os.path.exists(temp_file):
             os.remove(temp_file)
 
@@ -669,17 +1471,20 @@ def mixed_load_test(complexity: str, logger: logging.Logger) -> None:
     """
     Смешанная нагрузка (CPU + память + диск).
     Комбинирует различные типы нагрузки.
+    Массив для нагрузки на память выделяется один раз и перезаполняется на месте;
+    временный файл открыт на все время теста, строка результата пишется
+    и читается одним вызовом os.write/os.read с начала файла.
     """
     iterations = COMPLEXITY_SETTINGS["hash_calculation"][complexity] // 100
+    rng = create_rng()
+    memory_array = np.empty((1000, 1000))
     
-    # Создание временного файла
+    # Создание временного файла (O_BINARY нужен в Windows, на остальных системах равен 0)
     temp_file = "temp_mixed_test.txt"
+    fd = os.open(temp_file, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0))
     
-    try:
-        for i in range(iterations):
-            if interrupt_flag:
-                break
-            
+    def mixed_range(start: int, stop: int) -> None:
+        for i in range(start, stop):
             # CPU нагрузка
             x = i * 2.5
             cpu_result = 0
@@ -687,21 +1492,23 @@ def mixed_load_test(complexity: str, logger: logging.Logger) -> None:
                 cpu_result += np.sin(x + j) * np.cos(x - j)
             
             # Память нагрузка
-            memory_array = np.random.rand(1000, 1000)
-            memory_result = np.sum(memory_array)
+            rng.random(out=memory_array)
+            memory_result = memory_array.sum()
             
             # Диск нагрузка
-            with open(temp_file, 'w') as f:
-                f.write(f"Результат: {cpu_result + memory_result}\n")
-            
-            with open(temp_file, 'r') as f:
-                data = f.read()
+            line = f"Результат: {cpu_result + memory_result}\n".encode("utf-8")
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, line)
             
-            if i % (iterations // 10) == 0:
-                logger.debug(f"Смешанная нагрузка: {i}/{iterations}")
+            os.lseek(fd, 0, os.SEEK_SET)
+            data = os.read(fd, len(line))
+    
+    try:
+        run_chunked(mixed_range, iterations, BATCH_SETTINGS["mixed_chunk_size"], logger, "progress_mixed")
     
     finally:
-        # Удаление временного файла
+        # Закрытие и удаление временного файла
+        os.close(fd)
         if os.path.exists(temp_file):
             os.remove(temp_file)
 
@@ -719,9 +1526,7 @@ def run_performance_test(test_type: str, load_type: str, complexity: str,
     Args:
         performance_mode: Если True, программа работает до завершения задачи без ограничения времени
     """
-    logger.info(LOG_MESSAGES["test_start"].format(
-        start_time=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    ))
+    logger.info(LOG_MESSAGES["test_start"], {"start_time": datetime.now().strftime('%Y-%m-%d %H:%M:%S')})
     
     start_time = time.time()
     
@@ -762,23 +1567,42 @@ def run_performance_test(test_type: str, load_type: str, complexity: str,
     else:
         test_function_name = test_type
     
-    if test_function_name in test_functions:
-        # Запуск мониторинга в отдельном потоке
-        if performance_mode:
-            # В режиме производительности мониторим до завершения теста
-            monitor_thread = threading.Thread(target=start_monitoring_performance, args=(logger,))
+    # Варианты тестов для видеокарты
+    gpu_test_functions = {
+        "matrix_operations": matrix_operations_test_gpu,
+        "neural_simulation": neural_simulation_test_gpu
+    }
+    
+    if load_type in GPU_LOAD_TYPES and test_function_name in gpu_test_functions:
+        if gpu_available():
+            test_functions[test_function_name] = gpu_test_functions[test_function_name]
+            logger.info(LOG_MESSAGES["gpu_selected"], {"test_name": test_function_name})
         else:
-            # В обычном режиме мониторим заданное время
-            monitor_thread = threading.Thread(target=start_monitoring, args=(duration, logger))
+            logger.info(LOG_MESSAGES["gpu_unavailable"], {"test_name": test_function_name})
+    
+    if test_function_name in test_functions:
+        # Модули загружаются до запуска потоков и процессов
+        ensure_loaded(np, psutil, hashlib)
         
-        monitor_thread.daemon = True
+        # Единственный поток мониторинга; в обычном режиме он же ограничивает время теста
+        monitor_thread = threading.Thread(
+            target=monitor_system_resources,
+            args=(None if performance_mode else duration,),
+            daemon=True
+        )
         monitor_thread.start()
+        logger.debug("Мониторинг ресурсов запущен")
         
         # Запуск теста
         test_functions[test_function_name](complexity, logger)
         
-        # Ожидание завершения мониторинга
+        # В режиме производительности тест завершается вместе с задачей; в обычном
+        # режиме программа ждет окончания заданного времени (мониторинг сам установит
+        # stop_event по истечении duration или раньше — по Ctrl+C)
+        if performance_mode:
+            stop_event.set()
         monitor_thread.join()
+        logger.debug("Мониторинг ресурсов завершен")
     else:
         logger.error(f"Неизвестный тип теста: {test_function_name}")
         return {"error": f"Неизвестный тип теста: {test_function_name}"}
@@ -788,7 +1612,7 @@ def run_performance_test(test_type: str, load_type: str, complexity: str,
     if performance_mode:
         logger.info(f"Тест производительности завершен за {actual_duration:.2f} секунд")
     else:
-        logger.info(LOG_MESSAGES["test_complete"].format(duration=actual_duration))
+        logger.info(LOG_MESSAGES["test_complete"], {"duration": actual_duration})
     
     # Анализ результатов
     results = analyze_results(actual_duration, logger)
@@ -803,17 +1627,21 @@ def analyze_results(duration: float, logger: logging.Logger) -> Dict[str, Any]:
     Анализирует результаты тестирования.
     Использует данные мониторинга для расчета средних и пиковых значений.
     """
-    if not monitoring_data.get("cpu"): # Проверяем, что данные мониторинга заполнены
+    if not monitoring_data.get("cpu", {}).get("count"): # Проверяем, что данные мониторинга заполнены
         return {"error": "Нет данных мониторинга"}
     
-    # Расчет статистики
-    cpu_avg = np.mean(monitoring_data["cpu"])
-    cpu_peak = np.max(monitoring_data["cpu"])
-    ram_avg = np.mean(monitoring_data["mem"])
-    ram_peak = np.max(monitoring_data["mem"])
+    # Расчет статистики по накопленным суммам и пикам
+    cpu_stats = monitoring_data["cpu"]
+    mem_stats = monitoring_data["mem"]
+    cpu_temp_stats = monitoring_data["cpu_temp"]
+    gpu_temp_stats = monitoring_data["gpu_temp"]
+    cpu_avg = cpu_stats["total"] / cpu_stats["count"]
+    cpu_peak = cpu_stats["peak"]
+    ram_avg = mem_stats["total"] / mem_stats["count"]
+    ram_peak = mem_stats["peak"]
     
-    cpu_temp_avg = np.mean(monitoring_data["cpu_temp"]) if monitoring_data["cpu_temp"] else 0
-    gpu_temp_avg = np.mean(monitoring_data["gpu_temp"]) if monitoring_data["gpu_temp"] else 0
+    cpu_temp_avg = cpu_temp_stats["total"] / cpu_temp_stats["count"] if cpu_temp_stats["count"] else 0
+    gpu_temp_avg = gpu_temp_stats["total"] / gpu_temp_stats["count"] if gpu_temp_stats["count"] else 0
     
     results = {
         "duration": duration,
@@ -825,15 +1653,13 @@ def analyze_results(duration: float, logger: logging.Logger) -> Dict[str, Any]:
         "gpu_temperature_avg": gpu_temp_avg
     }
     
-    logger.info(LOG_MESSAGES["performance_results"].format(
-        cpu_avg=cpu_avg, cpu_peak=cpu_peak,
-        ram_avg=ram_avg, ram_peak=ram_peak
-    ))
+    logger.info(LOG_MESSAGES["performance_results"], {
+        "cpu_avg": cpu_avg, "cpu_peak": cpu_peak,
+        "ram_avg": ram_avg, "ram_peak": ram_peak
+    })
     
     if cpu_temp_avg > 0 or gpu_temp_avg > 0:
-        logger.info(LOG_MESSAGES["temperature_info"].format(
-            cpu_temp=cpu_temp_avg, gpu_temp=gpu_temp_avg
-        ))
+        logger.info(LOG_MESSAGES["temperature_info"], {"cpu_temp": cpu_temp_avg, "gpu_temp": gpu_temp_avg})
     
     return results
 
@@ -841,107 +1667,65 @@ def analyze_results(duration: float, logger: logging.Logger) -> Dict[str, Any]:
 def save_results_to_file(results: Dict[str, Any], test_config: Dict[str, Any], logger: logging.Logger) -> None:
     """
     Сохраняет результаты тестирования в отдельный файл.
-    Форматирует данные в читаемый формат.
+    Отчет собирается одним вызовом format_map по шаблону RESULT_TEMPLATES["report"]
+    и записывается одной операцией.
+    Время читается и форматируется один раз: оно используется в имени файла
+    и в строках даты отчета.
     """
     try:
         # Получение пути к файлу результатов
         test_type = test_config.get("test_type", "unknown")
-        file_path = get_file_path("output", "results", test_type=test_type)
+        now = datetime.now()
+        created_at = now.strftime('%Y-%m-%d %H:%M:%S')
+        file_path = get_file_path("output", "results", now=now, test_type=test_type)
         filename = os.path.basename(file_path)
         
-        # Получение информации о системе
-        system_info = get_system_info()
-        
-        # Создание содержимого файла
-        content = []
-        content.append("=" * 60)
-        content.append("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ ПРОИЗВОДИТЕЛЬНОСТИ СИСТЕМЫ")
-        content.append("=" * 60)
-        content.append(f"Дата и время: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        content.append("")
-        
-        # Информация о системе
-        content.append("ИНФОРМАЦИЯ О СИСТЕМЕ:")
-        content.append("-" * 30)
-        content.append(f"Операционная система: {system_info['os_name']}")
-        content.append(f"Версия ОС: {system_info['os_version']}")
-        content.append(f"Процессор: {system_info['processor']}")
-        content.append(f"Архитектура: {system_info['architecture']}")
-        content.append(f"Тип процессора: {system_info['processor_type']}")
-        content.append(f"Версия Python: {system_info['python_version']}")
-        content.append("")
-        
-        # Конфигурация теста
-        content.append("КОНФИГУРАЦИЯ ТЕСТА:")
-        content.append("-" * 30)
-        content.append(f"Тип теста: {test_config.get('test_type', 'N/A')}")
-        content.append(f"Тип нагрузки: {test_config.get('load_type', 'N/A')}")
-        content.append(f"Сложность: {test_config.get('complexity', 'N/A')}")
-        content.append(f"Планируемая продолжительность: {test_config.get('duration', 'N/A')} секунд")
-        content.append("")
-        
-        # Результаты тестирования
-        content.append("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ:")
-        content.append("-" * 30)
-        content.append(f"Фактическое время выполнения: {results.get('duration', 0):.2f} секунд")
-        content.append("")
-        
-        # Статистика CPU
-        content.append("ЗАГРУЗКА ПРОЦЕССОРА:")
-        content.append(f"  Средняя загрузка: {results.get('cpu_usage_avg', 0):.1f}%")
-        content.append(f"  Пиковая загрузка: {results.get('cpu_usage_peak', 0):.1f}%")
-        content.append("")
-        
-        # Статистика RAM
-        content.append("ИСПОЛЬЗОВАНИЕ ПАМЯТИ:")
-        content.append(f"  Среднее использование: {results.get('memory_usage_avg', 0):.1f}%")
-        content.append(f"  Пиковое использование: {results.get('memory_usage_peak', 0):.1f}%")
-        content.append("")
-        
         # Температура (если доступна)
         cpu_temp = results.get('cpu_temperature_avg', 0)
         gpu_temp = results.get('gpu_temperature_avg', 0)
-        
+        temperature_section = ""
         if cpu_temp > 0 or gpu_temp > 0:
-            content.append("ТЕМПЕРАТУРА:")
+            temperature_section = RESULT_TEMPLATES["report_temperature"]
             if cpu_temp > 0:
-                content.append(f"  Средняя температура CPU: {cpu_temp:.1f}°C")
+                temperature_section += RESULT_TEMPLATES["report_cpu_temperature"].format(cpu_temp)
             if gpu_temp > 0:
-                content.append(f"  Средняя температура GPU: {gpu_temp:.1f}°C")
-            content.append("")
-        
-        # Результаты расчетов
-        content.append("РЕЗУЛЬТАТЫ РАСЧЕТОВ:")
-        content.append("-" * 30)
-        content.append(f"Выполнено итераций: {calculation_results.get('iterations_completed', 0):,}")
-        content.append(f"Выполнено вычислений: {calculation_results.get('calculations_performed', 0):,}")
-        content.append(f"Обработано данных: {calculation_results.get('data_processed', 0):,}")
+                temperature_section += RESULT_TEMPLATES["report_gpu_temperature"].format(gpu_temp)
+            temperature_section += "\n"
         
         # Специфичные результаты теста
         test_specific = calculation_results.get('test_specific_results', {})
+        specific_section = ""
         if test_specific:
-            content.append("")
-            content.append("СПЕЦИФИЧНЫЕ РЕЗУЛЬТАТЫ ТЕСТА:")
-            for key, value in test_specific.items():
-                if isinstance(value, int):
-                    content.append(f"  {key.replace('_', ' ').title()}: {value:,}")
-                else:
-                    content.append(f"  {key.replace('_', ' ').title()}: {value}")
-        content.append("")
+            item_template = RESULT_TEMPLATES["report_specific_item"]
+            specific_section = RESULT_TEMPLATES["report_specific"] + "".join(
+                item_template.format(key.replace('_', ' ').title(), f"{value:,}" if isinstance(value, int) else value)
+                for key, value in test_specific.items()
+            )
         
-        # Дополнительная информация
-        content.append("ДОПОЛНИТЕЛЬНАЯ ИНФОРМАЦИЯ:")
-        content.append("-" * 30)
-        logs_dir = os.path.join(FILE_SYSTEM_CONFIG["base_path"], 
-                               FILE_SYSTEM_CONFIG["subdirectories"]["logs"]["name"])
-        content.append(f"Файл лога: {logs_dir}")
-        content.append(f"Время создания отчета: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        content.append("")
-        content.append("=" * 60)
+        # Поля шаблона: информация о системе, конфигурация, результаты и расчеты
+        content = RESULT_TEMPLATES["report"].format_map({
+            **get_system_info(),
+            "created_at": created_at,
+            "test_type": test_config.get('test_type', 'N/A'),
+            "load_type": test_config.get('load_type', 'N/A'),
+            "complexity": test_config.get('complexity', 'N/A'),
+            "planned_duration": test_config.get('duration', 'N/A'),
+            "duration": results.get('duration', 0),
+            "cpu_usage_avg": results.get('cpu_usage_avg', 0),
+            "cpu_usage_peak": results.get('cpu_usage_peak', 0),
+            "memory_usage_avg": results.get('memory_usage_avg', 0),
+            "memory_usage_peak": results.get('memory_usage_peak', 0),
+            "temperature_section": temperature_section,
+            "iterations_completed": calculation_results.get('iterations_completed', 0),
+            "calculations_performed": calculation_results.get('calculations_performed', 0),
+            "data_processed": calculation_results.get('data_processed', 0),
+            "specific_section": specific_section,
+            "logs_dir": DIRECTORY_PATHS['logs']
+        })
         
         # Запись в файл
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(content))
+            f.write(content)
         
         logger.info(f"Результаты сохранены в файл: {file_path}")
         print(f"\nРезультаты сохранены в файл: {filename}")
@@ -955,10 +1739,27 @@ def save_results_to_file(results: Dict[str, Any], test_config: Dict[str, Any], l
 # ФУНКЦИИ CLI И ИНТЕРАКТИВА
 # ============================================================================
 
-def parse_arguments():
+@functools.lru_cache(maxsize=1)
+def build_argument_parser() -> "argparse.ArgumentParser":
     """
-    Парсит аргументы командной строки для расширенного режима.
+    Создает парсер аргументов командной строки для расширенного режима.
+    Парсер строится один раз при первом вызове и затем переиспользуется.
+    В Python 3.14+ цветная справка отключена (color=False): argparse не проверяет
+    переменные окружения терминала при создании каждого форматтера.
+    argparse импортируется здесь, а не в начале файла: режимы без разбора
+    аргументов (и запуск с единственным --list-configs) его не загружают.
     """
+    import argparse
+    
+    min_duration, max_duration = TEST_SETTINGS["min_duration"], TEST_SETTINGS["max_duration"]
+    
+    def duration_argument(value: str) -> int:
+        # Проверка --duration при разборе аргументов (та же, что в интерактивном режиме)
+        if not value.isdecimal() or not is_valid_duration(int(value)):
+            raise argparse.ArgumentTypeError(DURATION_MESSAGES["argument"].format_map(TEST_SETTINGS))
+        return int(value)
+    
+    color_options = {"color": False} if sys.version_info >= (3, 14) else {}
     parser = argparse.ArgumentParser(
         description="Система тестирования производительности компьютера",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -969,52 +1770,134 @@ def parse_arguments():
   python main.py --interactive
   python main.py --test-type bitcoin_mining --duration 45
   python main.py --performance-mode --test-type matrix_operations --complexity hard
-        """
+        """,
+        **color_options
     )
     parser.add_argument("--config", "-c", type=str, help="Имя готовой конфигурации (quick, crypto, mining, math, prime, neural, cpu_benchmark, memory_benchmark, mixed_benchmark, crypto_benchmark)")
     parser.add_argument("--interactive", "-i", action="store_true", help="Интерактивный режим выбора параметров")
-    parser.add_argument("--test-type", "-t", type=str, choices=list(TEST_TYPES.keys()), help="Тип теста")
-    parser.add_argument("--load-type", "-l", type=str, choices=list(LOAD_TYPES.keys()), help="Тип нагрузки")
-    parser.add_argument("--complexity", "-x", type=str, choices=["easy", "medium", "hard"], help="Сложность теста")
-    parser.add_argument("--duration", "-d", type=int, help="Продолжительность теста в секундах")
-    parser.add_argument("--log-level", type=str, choices=["INFO", "DEBUG"], default="INFO", help="Уровень логирования")
+    parser.add_argument("--test-type", "-t", type=str, choices=TEST_TYPES, help="Тип теста")
+    parser.add_argument("--load-type", "-l", type=str, choices=LOAD_TYPES, help="Тип нагрузки")
+    parser.add_argument("--complexity", "-x", type=str, choices=COMPLEXITY_CHOICES, help="Сложность теста")
+    parser.add_argument("--duration", "-d", type=duration_argument, help=f"Продолжительность теста в секундах ({min_duration}-{max_duration})")
+    parser.add_argument("--log-level", type=str, choices=LOG_LEVELS, default="INFO", help="Уровень логирования")
     parser.add_argument("--list-configs", action="store_true", help="Показать список доступных конфигураций")
     parser.add_argument("--performance-mode", "-p", action="store_true", help="Режим тестирования производительности (без ограничения времени)")
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv: Optional[list] = None) -> "argparse.Namespace":
+    """
+    Парсит аргументы командной строки для расширенного режима.
+    argv — список аргументов (по умолчанию sys.argv[1:]).
+    """
+    return build_argument_parser().parse_args(argv)
 
 
 def print_all_configs() -> None:
     """
     Выводит список всех доступных конфигураций.
+    Конфигурации делятся на обычные и тесты производительности за один проход;
+    текст собирается в список строк и выводится одной записью в stdout.
     """
-    print("\n" + "="*60)
-    print("ДОСТУПНЫЕ КОНФИГУРАЦИИ ТЕСТОВ")
-    print("="*60)
-    
-    print("\n🔧 ОБЫЧНЫЕ ТЕСТЫ (с ограничением времени):")
-    print("-" * 40)
-    
-    for config_name, config in TEST_CONFIGS.items():
-        if not config.get("performance_mode", False):
-            print(f"\n📋 {config_name.upper()}")
-            print(f"   Тип теста: {config['test_type']}")
-            print(f"   Тип нагрузки: {config['load_type']}")
-            print(f"   Сложность: {config['complexity']}")
-            print(f"   Продолжительность: {config.get('duration', 'N/A')} секунд")
-            print(f"   Описание: {TEST_TYPES.get(config['test_type'], 'N/A')}")
-    
-    print("\n⚡ ТЕСТЫ ПРОИЗВОДИТЕЛЬНОСТИ (до завершения задачи):")
-    print("-" * 40)
+    describe = TEST_TYPES.get
+    normal_lines = [
+        "\n" + "="*60,
+        "ДОСТУПНЫЕ КОНФИГУРАЦИИ ТЕСТОВ",
+        "="*60,
+        "\n🔧 ОБЫЧНЫЕ ТЕСТЫ (с ограничением времени):",
+        "-" * 40
+    ]
+    performance_lines = ["\n⚡ ТЕСТЫ ПРОИЗВОДИТЕЛЬНОСТИ (до завершения задачи):", "-" * 40]
     
     for config_name, config in TEST_CONFIGS.items():
+        test_type = config['test_type']
         if config.get("performance_mode", False):
-            print(f"\n🚀 {config_name.upper()}")
-            print(f"   Тип теста: {config['test_type']}")
-            print(f"   Тип нагрузки: {config['load_type']}")
-            print(f"   Сложность: {config['complexity']}")
-            print(f"   Режим: Тест производительности (без ограничения времени)")
-            print(f"   Описание: {TEST_TYPES.get(config['test_type'], 'N/A')}")
-            print(f"   Назначение: Сравнение производительности разных систем")
+            performance_lines += (
+                f"\n🚀 {config_name.upper()}",
+                f"   Тип теста: {test_type}",
+                f"   Тип нагрузки: {config['load_type']}",
+                f"   Сложность: {config['complexity']}",
+                "   Режим: Тест производительности (без ограничения времени)",
+                f"   Описание: {describe(test_type, 'N/A')}",
+                "   Назначение: Сравнение производительности разных систем"
+            )
+        else:
+            normal_lines += (
+                f"\n📋 {config_name.upper()}",
+                f"   Тип теста: {test_type}",
+                f"   Тип нагрузки: {config['load_type']}",
+                f"   Сложность: {config['complexity']}",
+                f"   Продолжительность: {config.get('duration', 'N/A')} секунд",
+                f"   Описание: {describe(test_type, 'N/A')}"
+            )
+    
+    normal_lines += performance_lines
+    sys.stdout.write("\n".join(normal_lines) + "\n")
+
+
+def read_line(prompt: str) -> str:
+    """
+    Выводит приглашение и читает строку из stdin напрямую через sys.stdin.readline.
+    При конце ввода (EOF) вызывает EOFError, как input().
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line
+
+
+def is_valid_duration(duration: int) -> bool:
+    """
+    Проверяет, что продолжительность теста лежит в диапазоне
+    [TEST_SETTINGS["min_duration"], TEST_SETTINGS["max_duration"]].
+    Общая проверка для --duration и интерактивного ввода.
+    """
+    return TEST_SETTINGS["min_duration"] <= duration <= TEST_SETTINGS["max_duration"]
+
+
+def read_number(prompt: str, is_valid: Callable[[int], bool], error: str) -> Optional[int]:
+    """
+    Запрашивает целое число, пока ввод не будет корректным и is_valid(число) не вернет True.
+    Ввод проверяется через str.isdecimal без перехвата ValueError.
+    Возвращает None при пустом вводе (значение по умолчанию); error выводится
+    для числа, не прошедшего is_valid.
+    """
+    while True:
+        user_input = read_line(prompt).strip()
+        if user_input == "":
+            return None
+        if not user_input.isdecimal():
+            print("❌ Введите число или нажмите Enter.")
+            continue
+        number = int(user_input)
+        if is_valid(number):
+            return number
+        print(error)
+
+
+def choose_option(header: str, keys: tuple, descriptions: Dict[str, str], prompt: str, default: str) -> str:
+    """
+    Выводит нумерованное меню и запрашивает выбор пункта.
+    keys — ключи пунктов в порядке меню, descriptions — их описания
+    (пункт без описания выводится только ключом). Пустой ввод выбирает default.
+    Возвращает ключ выбранного пункта.
+    """
+    lines = [f"\n{header}"]
+    for i, key in enumerate(keys, 1):
+        description = descriptions.get(key)
+        label = f"{key} — {description}" if description else key
+        default_marker = " (по умолчанию)" if key == default else ""
+        lines.append(f"   {i}. {label}{default_marker}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    prompt_text = f"\n{prompt} (1-{len(keys)}) или Enter для значения по умолчанию: "
+    choice = read_number(prompt_text, lambda number: 1 <= number <= len(keys), "❌ Неверный выбор. Попробуйте снова.")
+    if choice is None:
+        print(f"✅ Используется значение по умолчанию: {default}")
+        return default
+    return keys[choice - 1]
 
 
 def interactive_config_selection() -> Dict[str, Any]:
@@ -1022,154 +1905,69 @@ def interactive_config_selection() -> Dict[str, Any]:
     Интерактивный выбор конфигурации теста с возможностью использования значений по умолчанию.
     Пользователь может нажать Enter для использования значений по умолчанию.
     """
-    print("\n" + "="*60)
-    print("🎯 ИНТЕРАКТИВНЫЙ ВЫБОР КОНФИГУРАЦИИ ТЕСТА")
-    print("="*60)
-    print("💡 Нажмите Enter для использования значений по умолчанию")
-    print(f"📋 Значения по умолчанию: {DEFAULT_VALUES['test_type']}, {DEFAULT_VALUES['load_type']}, {DEFAULT_VALUES['complexity']}, {DEFAULT_VALUES['duration']}с")
-    
-    # Выбор типа процессора
-    print(f"\n🖥️  Доступные типы процессоров:")
-    for i, (proc_type, description) in enumerate(PROCESSOR_TYPES.items(), 1):
-        default_marker = " (по умолчанию)" if proc_type == DEFAULT_VALUES["processor_type"] else ""
-        print(f"   {i}. {proc_type} — {description}{default_marker}")
-    print(f"   {len(PROCESSOR_TYPES) + 1}. auto — Автоматическое определение (по умолчанию)")
-    
-    while True:
-        try:
-            user_input = input(f"\nВыберите тип процессора (1-{len(PROCESSOR_TYPES) + 1}) или Enter для значения по умолчанию: ").strip()
-            if user_input == "":
-                processor_type = DEFAULT_VALUES["processor_type"]
-                print(f"✅ Используется значение по умолчанию: {processor_type}")
-                break
-            choice = int(user_input)
-            if 1 <= choice <= len(PROCESSOR_TYPES):
-                processor_type = list(PROCESSOR_TYPES.keys())[choice - 1]
-                break
-            elif choice == len(PROCESSOR_TYPES) + 1:
-                processor_type = "auto"
-                break
-            else:
-                print("❌ Неверный выбор. Попробуйте снова.")
-        except ValueError:
-            print("❌ Введите число или нажмите Enter.")
-    
-    # Выбор типа теста
-    print(f"\n📊 Доступные типы тестов:")
-    for i, (test_type, description) in enumerate(TEST_TYPES.items(), 1):
-        default_marker = " (по умолчанию)" if test_type == DEFAULT_VALUES["test_type"] else ""
-        print(f"   {i}. {test_type} — {description}{default_marker}")
-    
-    while True:
-        try:
-            user_input = input(f"\nВыберите тип теста (1-{len(TEST_TYPES)}) или Enter для значения по умолчанию: ").strip()
-            if user_input == "":
-                test_type = DEFAULT_VALUES["test_type"]
-                print(f"✅ Используется значение по умолчанию: {test_type}")
-                break
-            choice = int(user_input) - 1
-            if 0 <= choice < len(TEST_TYPES):
-                test_type = list(TEST_TYPES.keys())[choice]
-                break
-            else:
-                print("❌ Неверный выбор. Попробуйте снова.")
-        except ValueError:
-            print("❌ Введите число или нажмите Enter.")
-    
-    # Выбор типа нагрузки
-    print(f"\n⚡ Доступные типы нагрузки:")
-    for i, (load_type, description) in enumerate(LOAD_TYPES.items(), 1):
-        default_marker = " (по умолчанию)" if load_type == DEFAULT_VALUES["load_type"] else ""
-        print(f"   {i}. {load_type} — {description}{default_marker}")
-    
-    while True:
-        try:
-            user_input = input(f"\nВыберите тип нагрузки (1-{len(LOAD_TYPES)}) или Enter для значения по умолчанию: ").strip()
-            if user_input == "":
-                load_type = DEFAULT_VALUES["load_type"]
-                print(f"✅ Используется значение по умолчанию: {load_type}")
-                break
-            choice = int(user_input) - 1
-            if 0 <= choice < len(LOAD_TYPES):
-                load_type = list(LOAD_TYPES.keys())[choice]
-                break
-            else:
-                print("❌ Неверный выбор. Попробуйте снова.")
-        except ValueError:
-            print("❌ Введите число или нажмите Enter.")
-    
-    # Выбор сложности
-    print(f"\n🎯 Доступные уровни сложности:")
-    complexities = ["easy", "medium", "hard"]
-    for i, complexity in enumerate(complexities, 1):
-        default_marker = " (по умолчанию)" if complexity == DEFAULT_VALUES["complexity"] else ""
-        print(f"   {i}. {complexity}{default_marker}")
-    
-    while True:
-        try:
-            user_input = input(f"\nВыберите сложность (1-{len(complexities)}) или Enter для значения по умолчанию: ").strip()
-            if user_input == "":
-                complexity = DEFAULT_VALUES["complexity"]
-                print(f"✅ Используется значение по умолчанию: {complexity}")
-                break
-            choice = int(user_input) - 1
-            if 0 <= choice < len(complexities):
-                complexity = complexities[choice]
-                break
-            else:
-                print("❌ Неверный выбор. Попробуйте снова.")
-        except ValueError:
-            print("❌ Введите число или нажмите Enter.")
+    write = sys.stdout.write
+    write("\n".join((
+        "\n" + "="*60,
+        "🎯 ИНТЕРАКТИВНЫЙ ВЫБОР КОНФИГУРАЦИИ ТЕСТА",
+        "="*60,
+        "💡 Нажмите Enter для использования значений по умолчанию",
+        f"📋 Значения по умолчанию: {DEFAULT_VALUES['test_type']}, {DEFAULT_VALUES['load_type']}, {DEFAULT_VALUES['complexity']}, {DEFAULT_VALUES['duration']}с\n"
+    )))
+    
+    # Выбор типа процессора, теста, нагрузки и сложности
+    processor_type = choose_option(
+        "🖥️  Доступные типы процессоров:", PROCESSOR_TYPE_KEYS + ("auto",),
+        {**PROCESSOR_TYPES, "auto": "Автоматическое определение"},
+        "Выберите тип процессора", DEFAULT_VALUES["processor_type"]
+    )
+    test_type = choose_option(
+        "📊 Доступные типы тестов:", TEST_TYPE_KEYS, TEST_TYPES,
+        "Выберите тип теста", DEFAULT_VALUES["test_type"]
+    )
+    load_type = choose_option(
+        "⚡ Доступные типы нагрузки:", LOAD_TYPE_KEYS, LOAD_TYPES,
+        "Выберите тип нагрузки", DEFAULT_VALUES["load_type"]
+    )
+    complexity = choose_option(
+        "🎯 Доступные уровни сложности:", COMPLEXITY_LEVELS, {},
+        "Выберите сложность", DEFAULT_VALUES["complexity"]
+    )
     
     # Выбор режима производительности
-    print(f"\n🚀 Режим тестирования:")
-    print(f"   1. Обычный режим — тест выполняется заданное время")
-    print(f"   2. Режим производительности — тест выполняется до завершения (для сравнения систем)")
     default_mode = "1" if not DEFAULT_VALUES["performance_mode"] else "2"
     default_marker = " (по умолчанию)" if not DEFAULT_VALUES["performance_mode"] else " (по умолчанию)"
-    print(f"   По умолчанию: Обычный режим{default_marker}")
-    
-    while True:
-        try:
-            user_input = input(f"\nВыберите режим (1-2) или Enter для значения по умолчанию: ").strip()
-            if user_input == "":
-                performance_mode = DEFAULT_VALUES["performance_mode"]
-                mode_name = "Режим производительности" if performance_mode else "Обычный режим"
-                print(f"✅ Используется значение по умолчанию: {mode_name}")
-                break
-            choice = int(user_input)
-            if choice == 1:
-                performance_mode = False
-                break
-            elif choice == 2:
-                performance_mode = True
-                break
-            else:
-                print("❌ Выберите 1 или 2.")
-        except ValueError:
-            print("❌ Введите число или нажмите Enter.")
+    write("\n".join((
+        "\n🚀 Режим тестирования:",
+        "   1. Обычный режим — тест выполняется заданное время",
+        "   2. Режим производительности — тест выполняется до завершения (для сравнения систем)",
+        f"   По умолчанию: Обычный режим{default_marker}\n"
+    )))
+    
+    mode_prompt = "\nВыберите режим (1-2) или Enter для значения по умолчанию: "
+    choice = read_number(mode_prompt, lambda number: number in (1, 2), "❌ Выберите 1 или 2.")
+    if choice is None:
+        performance_mode = DEFAULT_VALUES["performance_mode"]
+        mode_name = "Режим производительности" if performance_mode else "Обычный режим"
+        print(f"✅ Используется значение по умолчанию: {mode_name}")
+    else:
+        performance_mode = choice == 2
     
     # Выбор продолжительности (только для обычного режима)
     if not performance_mode:
-        print(f"\n⏱️  Продолжительность теста:")
-        print(f"   Минимум: {TEST_SETTINGS['min_duration']} секунд")
-        print(f"   Максимум: {TEST_SETTINGS['max_duration']} секунд")
-        print(f"   По умолчанию: {DEFAULT_VALUES['duration']} секунд")
+        min_duration, max_duration = TEST_SETTINGS['min_duration'], TEST_SETTINGS['max_duration']
+        write("\n".join((
+            "\n⏱️  Продолжительность теста:",
+            f"   Минимум: {min_duration} секунд",
+            f"   Максимум: {max_duration} секунд",
+            f"   По умолчанию: {DEFAULT_VALUES['duration']} секунд\n"
+        )))
         
-        while True:
-            try:
-                user_input = input(f"\nВведите продолжительность ({TEST_SETTINGS['min_duration']}-{TEST_SETTINGS['max_duration']}с) или Enter для значения по умолчанию: ").strip()
-                if user_input == "":
-                    duration = DEFAULT_VALUES["duration"]
-                    print(f"✅ Используется значение по умолчанию: {duration} секунд")
-                    break
-                duration = int(user_input)
-                if TEST_SETTINGS['min_duration'] <= duration <= TEST_SETTINGS['max_duration']:
-                    break
-                else:
-                    print(f"❌ Продолжительность должна быть от {TEST_SETTINGS['min_duration']} до {TEST_SETTINGS['max_duration']} секунд.")
-            except ValueError:
-                print("❌ Введите число или нажмите Enter.")
+        duration_prompt = f"\nВведите продолжительность ({min_duration}-{max_duration}с) или Enter для значения по умолчанию: "
+        duration_error = DURATION_MESSAGES["interactive"].format_map(TEST_SETTINGS)
+        duration = read_number(duration_prompt, is_valid_duration, duration_error)
+        if duration is None:
+            duration = DEFAULT_VALUES["duration"]
+            print(f"✅ Используется значение по умолчанию: {duration} секунд")
     else:
         duration = 0  # Для режима производительности время не важно
         print(f"\n✅ В режиме производительности тест выполняется до завершения")
@@ -1183,17 +1981,20 @@ def interactive_config_selection() -> Dict[str, Any]:
         "processor_type": processor_type
     }
     
-    print(f"\n" + "="*50)
-    print(f"✅ ИТОГОВАЯ КОНФИГУРАЦИЯ:")
-    print(f"   🖥️  Тип процессора: {processor_type}")
-    print(f"   📊 Тип теста: {test_type} — {TEST_TYPES[test_type]}")
-    print(f"   ⚡ Тип нагрузки: {load_type} — {LOAD_TYPES[load_type]}")
-    print(f"   🎯 Сложность: {complexity}")
+    summary = [
+        "\n" + "="*50,
+        "✅ ИТОГОВАЯ КОНФИГУРАЦИЯ:",
+        f"   🖥️  Тип процессора: {processor_type}",
+        f"   📊 Тип теста: {test_type} — {TEST_TYPES[test_type]}",
+        f"   ⚡ Тип нагрузки: {load_type} — {LOAD_TYPES[load_type]}",
+        f"   🎯 Сложность: {complexity}"
+    ]
     if not performance_mode:
-        print(f"   ⏱️  Продолжительность: {duration} секунд")
+        summary.append(f"   ⏱️  Продолжительность: {duration} секунд")
     mode_name = "Режим производительности" if performance_mode else "Обычный режим"
-    print(f"   🚀 Режим: {mode_name}")
-    print(f"="*50)
+    summary += (f"   🚀 Режим: {mode_name}", "="*50)
+    write("\n".join(summary) + "\n")
+    sys.stdout.flush()
     
     return config
 
@@ -1201,38 +2002,107 @@ def interactive_config_selection() -> Dict[str, Any]:
 def signal_handler(signum, frame):
     """
     Обработчик сигналов для корректного завершения.
-    Устанавливает флаг прерывания и выводит сообщение.
+    Устанавливает событие остановки stop_event и выводит сообщение.
+    Сообщение пишется в stderr одним вызовом os.write: print внутри обработчика
+    может прервать запись основного потока в тот же буфер sys.stdout.
     """
-    global interrupt_flag
-    interrupt_flag = True
-    print("\n⚠️  Прерывание выполнения (Ctrl+C)")
-    print("Завершение программы...")
+    # Событие multiprocessing защищено нерекурсивной блокировкой: если сигнал пришел,
+    # пока основной поток держит ее в stop_event.is_set(), вызов set() здесь
+    # привел бы к взаимоблокировке, поэтому событие устанавливается из отдельного потока
+    threading.Thread(target=stop_event.set, daemon=True).start()
+    os.write(2, INTERRUPT_MESSAGE)
 
 
 # ============================================================================
 # ОСНОВНЫЕ ФУНКЦИИ ЗАПУСКА
 # ============================================================================
 
-def run_basic_mode():
+def print_results(results: Dict[str, Any]) -> None:
     """
-    Запуск базового режима (минимальный CLI).
+    Выводит итоги теста в консоль по шаблонам RESULT_TEMPLATES.
+    Отсутствующие в results значения выводятся как 0.
+    """
+    values = defaultdict(float, results)
+    text = RESULT_TEMPLATES["summary"].format_map(values)
+    if values["cpu_temperature_avg"] > 0:
+        text += RESULT_TEMPLATES["cpu_temperature"].format_map(values)
+    if values["gpu_temperature_avg"] > 0:
+        text += RESULT_TEMPLATES["gpu_temperature"].format_map(values)
+    sys.stdout.write(text)
+
+
+def get_test_config(config_name: str) -> Dict[str, Any]:
+    """
+    Возвращает копию конфигурации TEST_CONFIGS по имени (DEFAULT_TEST_CONFIG, если имя неизвестно).
+    Каждый вызов возвращает новый словарь, поэтому изменения конфигурации
+    вызывающим кодом не переносятся в следующие запуски.
+    """
+    return dict(TEST_CONFIGS.get(config_name, DEFAULT_TEST_CONFIG))
+
+
+@contextmanager
+def test_session(logger: logging.Logger):
+    """
+    Контекст выполнения теста: ошибка внутри блока логируется и выводится
+    в консоль, по выходе всегда записывается завершение программы.
+    """
+    try:
+        yield
+    except Exception as e:
+        logger.error(LOG_MESSAGES["error_occurred"], {"error_message": e})
+        print(f"Ошибка: {e}")
+    finally:
+        logger.info(LOG_MESSAGES["program_exit"])
+        print("\nПрограмма завершена.")
+
+
+def run_session(resolve_config: Callable[[logging.Logger], Dict[str, Any]], log_level: str = "INFO") -> None:
+    """
+    Общий сценарий запуска для всех режимов.
+    Создает директории, настраивает логирование,
+    получает конфигурацию теста через resolve_config(logger), запускает тест,
+    сохраняет и выводит результаты.
     """
-    # Настройка обработчика сигналов
-    signal.signal(signal.SIGINT, signal_handler)
-    
     # Создание директорий
     setup_directories()
     
     # Настройка логирования
-    logger = setup_logging("INFO")
+    logger = setup_logging(log_level)
     
     # Получение информации о системе
     system_info = get_system_info()
     
     # Логирование запуска программы
     logger.info(LOG_MESSAGES["program_start"])
-    logger.info(LOG_MESSAGES["system_info"].format(**system_info))
+    logger.info(LOG_MESSAGES["system_info"], system_info)
     
+    # Определение конфигурации теста
+    test_config = resolve_config(logger)
+    performance_mode = test_config.get("performance_mode", False)
+    test_type = test_config["test_type"]
+    load_type = test_config["load_type"]
+    complexity = test_config["complexity"]
+    duration = test_config.get("duration", TEST_SETTINGS["default_duration"])
+    
+    # Логирование конфигурации теста (общий словарь конфигурации для обоих шаблонов)
+    message_key = "test_config_performance" if performance_mode else "test_config"
+    logger.info(LOG_MESSAGES[message_key], test_config)
+    
+    with test_session(logger):
+        # Запуск теста
+        results = run_performance_test(test_type, load_type, complexity, duration, logger, performance_mode)
+        
+        # Сохранение результатов в файл
+        save_results_to_file(results, test_config, logger)
+        
+        # Вывод результатов
+        print_results(results)
+
+
+def run_basic_mode():
+    """
+    Запуск базового режима (минимальный CLI).
+    """
     # Настройки теста (можно изменить)
     test_config = {
         "test_type": "bitcoin_mining",
@@ -1240,92 +2110,35 @@ def run_basic_mode():
         "complexity": "medium",
         "duration": TEST_SETTINGS["default_duration"]
     }
-    
-    # Логирование конфигурации теста
-    if test_config.get("performance_mode", False):
-        logger.info(f"Тип теста: {test_config['test_type']}, Нагрузка: {test_config['load_type']}, Сложность: {test_config['complexity']}, Режим: Тест производительности")
-    else:
-        logger.info(LOG_MESSAGES["test_config"].format(**test_config))
-    
-    try:
-        # Проверяем режим производительности
-        performance_mode = test_config.get("performance_mode", False)
-        
-        # Запуск теста
-        results = run_performance_test(
-            test_config["test_type"],
-            test_config["load_type"],
-            test_config["complexity"],
-            test_config.get("duration", TEST_SETTINGS["default_duration"]),
-            logger,
-            performance_mode
-        )
-        
-        # Сохранение результатов в файл
-        save_results_to_file(results, test_config, logger)
-        
-        # Вывод результатов
-        print("\n" + "="*50)
-        print("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ")
-        print("="*50)
-        print(f"Время выполнения: {results.get('duration', 0):.2f} секунд")
-        print(f"Средняя загрузка CPU: {results.get('cpu_usage_avg', 0):.1f}%")
-        print(f"Пиковая загрузка CPU: {results.get('cpu_usage_peak', 0):.1f}%")
-        print(f"Средняя загрузка RAM: {results.get('memory_usage_avg', 0):.1f}%")
-        print(f"Пиковая загрузка RAM: {results.get('memory_usage_peak', 0):.1f}%")
-        
-        if results.get('cpu_temperature_avg', 0) > 0:
-            print(f"Средняя температура CPU: {results.get('cpu_temperature_avg', 0):.1f}°C")
-        if results.get('gpu_temperature_avg', 0) > 0:
-            print(f"Средняя температура GPU: {results.get('gpu_temperature_avg', 0):.1f}°C")
-        
-    except Exception as e:
-        logger.error(LOG_MESSAGES["error_occurred"].format(error_message=str(e)))
-        print(f"Ошибка: {e}")
-    
-    finally:
-        logger.info(LOG_MESSAGES["program_exit"])
-        print("\nПрограмма завершена.")
+    run_session(lambda logger: test_config)
 
 
 def run_advanced_mode():
     """
     Запуск расширенного режима (аргументы командной строки, конфиги, интерактив).
     """
+    # Единственный аргумент --list-configs: список конфигураций без построения парсера
+    if sys.argv[1:] == ["--list-configs"]:
+        print_all_configs()
+        return
+    
     # Парсинг аргументов
     args = parse_arguments()
     
-    # Показать список конфигураций и выйти
+    # Показать список конфигураций и выйти (в том числе для сокращения --list)
     if args.list_configs:
         print_all_configs()
         return
     
-    # Настройка обработчика сигналов
-    signal.signal(signal.SIGINT, signal_handler)
-    
-    # Создание директорий
-    setup_directories()
-    
-    # Настройка логирования
-    logger = setup_logging(args.log_level)
-    
-    # Получение информации о системе
-    system_info = get_system_info()
-    
-    # Логирование запуска программы
-    logger.info(LOG_MESSAGES["program_start"])
-    logger.info(LOG_MESSAGES["system_info"].format(**system_info))
-    
-    # Определение конфигурации теста
-    if args.interactive:
-        logger.info(LOG_MESSAGES["interactive_mode"])
-        test_config = interactive_config_selection()
-    elif args.config:
-        test_config = TEST_CONFIGS.get(args.config, TEST_CONFIGS["quick"])
-        logger.info(LOG_MESSAGES["config_selected"].format(config_name=args.config))
-    else:
+    def resolve_config(logger: logging.Logger) -> Dict[str, Any]:
+        if args.interactive:
+            logger.info(LOG_MESSAGES["interactive_mode"])
+            return interactive_config_selection()
+        if args.config:
+            logger.info(LOG_MESSAGES["config_selected"], {"config_name": args.config})
+            return get_test_config(args.config)
         # Использование аргументов командной строки или значений по умолчанию
-        test_config = {
+        return {
             "test_type": args.test_type or "bitcoin_mining",
             "load_type": args.load_type or "CPU",
             "complexity": args.complexity or "medium",
@@ -1333,191 +2146,47 @@ def run_advanced_mode():
             "performance_mode": args.performance_mode
         }
     
-    # Логирование конфигурации теста
-    logger.info(LOG_MESSAGES["test_config"].format(**test_config))
-    
-    try:
-        # Запуск теста
-        results = run_performance_test(
-            test_config["test_type"],
-            test_config["load_type"],
-            test_config["complexity"],
-            test_config.get("duration", TEST_SETTINGS["default_duration"]),
-            logger,
-            test_config.get("performance_mode", False)
-        )
-        
-        # Сохранение результатов в файл
-        save_results_to_file(results, test_config, logger)
-        
-        # Вывод результатов
-        print("\n" + "="*50)
-        print("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ")
-        print("="*50)
-        print(f"Время выполнения: {results.get('duration', 0):.2f} секунд")
-        print(f"Средняя загрузка CPU: {results.get('cpu_usage_avg', 0):.1f}%")
-        print(f"Пиковая загрузка CPU: {results.get('cpu_usage_peak', 0):.1f}%")
-        print(f"Средняя загрузка RAM: {results.get('memory_usage_avg', 0):.1f}%")
-        print(f"Пиковая загрузка RAM: {results.get('memory_usage_peak', 0):.1f}%")
-        
-        if results.get('cpu_temperature_avg', 0) > 0:
-            print(f"Средняя температура CPU: {results.get('cpu_temperature_avg', 0):.1f}°C")
-        if results.get('gpu_temperature_avg', 0) > 0:
-            print(f"Средняя температура GPU: {results.get('gpu_temperature_avg', 0):.1f}°C")
-        
-    except Exception as e:
-        logger.error(LOG_MESSAGES["error_occurred"].format(error_message=str(e)))
-        print(f"Ошибка: {e}")
-    
-    finally:
-        logger.info(LOG_MESSAGES["program_exit"])
-        print("\nПрограмма завершена.")
+    run_session(resolve_config, args.log_level)
 
 
 def run_interactive_mode():
     """
     Запуск интерактивного режима.
     """
-    # Настройка обработчика сигналов
-    signal.signal(signal.SIGINT, signal_handler)
-    
-    # Создание директорий
-    setup_directories()
-    
-    # Настройка логирования
-    logger = setup_logging("INFO")
-    
-    # Получение информации о системе
-    system_info = get_system_info()
-    
-    # Логирование запуска программы
-    logger.info(LOG_MESSAGES["program_start"])
-    logger.info(LOG_MESSAGES["system_info"].format(**system_info))
-    
-    # Интерактивный выбор конфигурации
-    logger.info(LOG_MESSAGES["interactive_mode"])
-    test_config = interactive_config_selection()
-    
-    # Логирование конфигурации теста
-    logger.info(LOG_MESSAGES["test_config"].format(**test_config))
-    
-    try:
-        # Запуск теста
-        results = run_performance_test(
-            test_config["test_type"],
-            test_config["load_type"],
-            test_config["complexity"],
-            test_config["duration"],
-            logger,
-            test_config.get("performance_mode", False)
-        )
-        
-        # Сохранение результатов в файл
-        save_results_to_file(results, test_config, logger)
-        
-        # Вывод результатов
-        print("\n" + "="*50)
-        print("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ")
-        print("="*50)
-        print(f"Время выполнения: {results.get('duration', 0):.2f} секунд")
-        print(f"Средняя загрузка CPU: {results.get('cpu_usage_avg', 0):.1f}%")
-        print(f"Пиковая загрузка CPU: {results.get('cpu_usage_peak', 0):.1f}%")
-        print(f"Средняя загрузка RAM: {results.get('memory_usage_avg', 0):.1f}%")
-        print(f"Пиковая загрузка RAM: {results.get('memory_usage_peak', 0):.1f}%")
-        
-        if results.get('cpu_temperature_avg', 0) > 0:
-            print(f"Средняя температура CPU: {results.get('cpu_temperature_avg', 0):.1f}°C")
-        if results.get('gpu_temperature_avg', 0) > 0:
-            print(f"Средняя температура GPU: {results.get('gpu_temperature_avg', 0):.1f}°C")
-        
-    except Exception as e:
-        logger.error(LOG_MESSAGES["error_occurred"].format(error_message=str(e)))
-        print(f"Ошибка: {e}")
+    def resolve_config(logger: logging.Logger) -> Dict[str, Any]:
+        logger.info(LOG_MESSAGES["interactive_mode"])
+        return interactive_config_selection()
     
-    finally:
-        logger.info(LOG_MESSAGES["program_exit"])
-        print("\nПрограмма завершена.")
+    run_session(resolve_config)
 
 
-def run_config_mode():
+def run_config_mode(config_name: str = "mining"):
     """
     Запуск с определённой конфигурацией из TEST_CONFIGS.
+    config_name — имя конфигурации (по умолчанию "mining").
     """
-    # Выбираем конфигурацию (можно изменить)
-    config_name = "mining"  # Измените на нужную конфигурацию
-    
-    # Настройка обработчика сигналов
-    signal.signal(signal.SIGINT, signal_handler)
-    
-    # Создание директорий
-    setup_directories()
+    def resolve_config(logger: logging.Logger) -> Dict[str, Any]:
+        logger.info(LOG_MESSAGES["config_selected"], {"config_name": config_name})
+        return get_test_config(config_name)
     
-    # Настройка логирования
-    logger = setup_logging("INFO")
-    
-    # Получение информации о системе
-    system_info = get_system_info()
-    
-    # Логирование запуска программы
-    logger.info(LOG_MESSAGES["program_start"])
-    logger.info(LOG_MESSAGES["system_info"].format(**system_info))
-    
-    # Получение конфигурации
-    test_config = TEST_CONFIGS.get(config_name, TEST_CONFIGS["quick"])
-    logger.info(LOG_MESSAGES["config_selected"].format(config_name=config_name))
-    
-    # Логирование конфигурации теста
-    logger.info(LOG_MESSAGES["test_config"].format(**test_config))
-    
-    try:
-        # Запуск теста
-        results = run_performance_test(
-            test_config["test_type"],
-            test_config["load_type"],
-            test_config["complexity"],
-            test_config["duration"],
-            logger
-        )
-        
-        # Сохранение результатов в файл
-        save_results_to_file(results, test_config, logger)
-        
-        # Вывод результатов
-        print("\n" + "="*50)
-        print("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ")
-        print("="*50)
-        print(f"Время выполнения: {results.get('duration', 0):.2f} секунд")
-        print(f"Средняя загрузка CPU: {results.get('cpu_usage_avg', 0):.1f}%")
-        print(f"Пиковая загрузка CPU: {results.get('cpu_usage_peak', 0):.1f}%")
-        print(f"Средняя загрузка RAM: {results.get('memory_usage_avg', 0):.1f}%")
-        print(f"Пиковая загрузка RAM: {results.get('memory_usage_peak', 0):.1f}%")
-        
-        if results.get('cpu_temperature_avg', 0) > 0:
-            print(f"Средняя температура CPU: {results.get('cpu_temperature_avg', 0):.1f}°C")
-        if results.get('gpu_temperature_avg', 0) > 0:
-            print(f"Средняя температура GPU: {results.get('gpu_temperature_avg', 0):.1f}°C")
-        
-    except Exception as e:
-        logger.error(LOG_MESSAGES["error_occurred"].format(error_message=str(e)))
-        print(f"Ошибка: {e}")
-    
-    finally:
-        logger.info(LOG_MESSAGES["program_exit"])
-        print("\nПрограмма завершена.")
+    run_session(resolve_config)
 
 # ============================================================================
 # ЗАПУСК ПРОГРАММЫ В ЗАВИСИМОСТИ ОТ RUN_MODE
 # ============================================================================
 if __name__ == "__main__":
+    # Обработчик Ctrl+C устанавливается один раз для любого режима
+    signal.signal(signal.SIGINT, signal_handler)
+    
     # В зависимости от RUN_MODE вызываем нужный main-функционал
-    if RUN_MODE == 'basic':
-        run_basic_mode()
-    elif RUN_MODE == 'advanced':
-        run_advanced_mode()
-    elif RUN_MODE == 'interactive':
-        run_interactive_mode()
-    elif RUN_MODE == 'config':
-        run_config_mode()
-    else:
+    run_modes = {
+        'basic': run_basic_mode,
+        'advanced': run_advanced_mode,
+        'interactive': run_interactive_mode,
+        'config': run_config_mode
+    }
+    run_mode = run_modes.get(RUN_MODE)
+    if run_mode is None:
         print(f"Неизвестный режим RUN_MODE: {RUN_MODE}")
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1)
+    run_mode()